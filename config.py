@@ -1,4 +1,5 @@
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Self
 import streamlit as st
@@ -33,6 +34,16 @@ class DefaultValues(BaseModel):
     profile_message: str = Field(default="<p></p>")
     no_recipes_found: str = Field(default="No recipes found.")
 
+    @cached_property
+    def user_coverage_pct(self) -> float:
+        """user_coverage as a slider percentage."""
+        return self.user_coverage * 100.0
+
+    @cached_property
+    def recipe_coverage_pct(self) -> float:
+        """recipe_coverage as a slider percentage."""
+        return self.recipe_coverage * 100.0
+
 
 class LogConfig(BaseModel):
     """Configuration for logging."""
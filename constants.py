@@ -31,7 +31,7 @@ class CategoryKeys(StrEnum):
     HOLIDAY = "holiday"
 
 
-class RecipeKeys(StrEnum):
+class RecipeKeys:
     """Keys within recipe data dictionaries (from DB/API)."""
 
     TITLE = "title"
@@ -61,7 +61,6 @@ class FormatStrings(StrEnum):
     """String templates for formatting."""
 
     TIMESTAMP_ISO_SECONDS = "seconds"
-    TIMESTAMP_CACHE_KEY = "%Y%m%d%H%M%S"
     ENCODING_UTF8 = "utf-8"
     ENCODING_ERRORS_REPLACE = "replace"
     SLIDER_PERCENT = "%.0f%%"
@@ -84,6 +83,7 @@ class MiscValues(StrEnum):
     HTTPS_PREFIX = "https://"
     DEFAULT_STEP = "?"
     CACHE_DIR = "recipe_cache"
+    PDF_MIME = "application/pdf"
 
 
 class ConfigKeys(StrEnum):
@@ -172,6 +172,10 @@ class DbKeys(StrEnum):
         WHERE source_domain IS NOT NULL
         ORDER BY source_domain
     """
+    SQL_CREATE_INGREDIENT_INDEX = """
+        CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_normalized
+        ON recipe_ingredients (normalized_ingredient, url)
+    """
 
 
 class ProfileDataKeys(StrEnum):
@@ -202,6 +206,39 @@ class ProfileDataKeys(StrEnum):
     SOURCES = "sources"
 
 
+class ProfileWireKeys(StrEnum):
+    """Short keys for the serialized profile options; names mirror ProfileDataKeys."""
+
+    VERSION = "v"
+    INGREDIENTS_TEXT = "i"
+    MUST_USE_TEXT = "mu"
+    EXCLUDED_BOX = "x"
+    KEYWORDS_INCLUDE = "ki"
+    KEYWORDS_EXCLUDE = "kx"
+    MIN_ING_MATCHES = "mm"
+    COURSE_FILTER = "c"
+    MAIN_ING_FILTER = "mi"
+    DISH_TYPE_FILTER = "d"
+    RECIPE_TYPE_FILTER = "r"
+    CUISINE_FILTER = "cu"
+    EXCLUDE_COURSE_FILTER = "xc"
+    EXCLUDE_MAIN_ING_FILTER = "xmi"
+    EXCLUDE_DISH_TYPE_FILTER = "xd"
+    EXCLUDE_RECIPE_TYPE_FILTER = "xr"
+    EXCLUDE_CUISINE_FILTER = "xcu"
+    TAG_FILTER_MODE = "t"
+    MAX_STEPS = "ms"
+    USER_COVERAGE_SLIDER = "uc"
+    RECIPE_COVERAGE_SLIDER = "rc"
+    SOURCES = "s"
+
+
+class ProfileWireVersion(IntEnum):
+    """Version tag written under ProfileWireKeys.VERSION."""
+
+    COMPACT = 2
+
+
 class ToolNames(StrEnum):
     """Executable tool names."""
 
@@ -370,9 +407,6 @@ class LogMsg(StrEnum):
     SOURCES_FETCHED_COUNT = "Fetched {count} distinct sources."
     SOURCES_FETCH_INIT_FAIL = "Failed to fetch initial source data."
     SOURCES_FETCH_UNEXPECTED_ERROR = "Unexpected error fetching sources: {error}"
-    SOURCES_REFRESH_DB_TIME_FAIL = (
-        "Could not determine recipe database update time. Refresh failed."
-    )
     SOURCES_REFRESH_FAIL = "Failed to refresh sources: {error}"
     SOURCES_REFRESHED = "Sources refreshed and session state updated."
 
@@ -399,6 +433,7 @@ class LogMsg(StrEnum):
     RECIPE_LABEL_NOT_FOUND_IN_OPTIONS = (
         "Selected recipe label '{label}' not found in options, defaulting index."
     )
+    RECIPE_DB_MISSING = "Recipe DB not found after fetching essential files: {db_path}"
 
     ADV_SEARCH_CLICKED = "Advanced search button clicked."
     ADV_SEARCH_PARAMS = "Calling query_top_k with params: {params_json}"
@@ -422,6 +457,7 @@ class LogMsg(StrEnum):
     PROFILE_SAVE_CLICKED = "Save profile button clicked."
     PROFILE_ENCODE_FAIL = "Failed to encode profile data: {error}"
     PROFILE_SAVE_ACTION_FAIL = "Failed to save profile via UI action: {error}"
+    PROFILE_SAVE_UNCHANGED = "Profile unchanged since last save, skipping save."
     PROFILE_LOAD_CLICKED = "Load profile button clicked."
     PROFILE_LOADED_RERUN = "Profile loaded for {username}, triggering rerun."
     PROFILE_INVALID_MODE_LOADED = (
@@ -440,7 +476,7 @@ class LogMsg(StrEnum):
     LIBRARY_PROCESSING_BOOK = "Processing '{filename}'... Please wait."
     LIBRARY_DETAILS_NOT_FOUND = "Details not found for selected book: {label}"
     LIBRARY_MISSING_DETAILS = "Missing critical book details (ID, name, or local path)."
-    LIBRARY_ENCODING_PDF = "Reading and encoding PDF for new tab link: {pdf_path}"
+    LIBRARY_ENCODING_PDF = "Preparing PDF download button: {pdf_path}"
     LIBRARY_LINK_GENERATED = "Link generated for book: {label}"
     LIBRARY_PDF_CONVERT_ERROR = "PDF Conversion/Link Prep Error: File not found at '{path}' for book '{label}': {error}"
     LIBRARY_CONVERT_LINK_FAIL = (
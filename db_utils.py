@@ -208,10 +208,10 @@ def load_profile(username: str) -> dict[str, Any] | None:
 
 
 @st.cache_resource(ttl=600)
-def fetch_sources_cached(db_last_updated_time_key: str | None) -> list[str] | None:
+def fetch_sources_cached(db_last_updated_time_key: datetime | None) -> list[str] | None:
     """
     Cached function to fetch distinct source domains from the recipe database.
-    Uses a stable string representation of update time for cache keying.
+    Keyed on the recipe DB's last update time, so a new DB misses the cache.
     """
     log_with_payload(
         logging.INFO,
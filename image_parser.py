@@ -1,4 +1,5 @@
 import base64
+from functools import lru_cache
 
 from config import AppConfig
 from process_images import CacheManager, MistralInterface
@@ -29,5 +30,12 @@ class ImageParser:
         return []
 
 
+@lru_cache(maxsize=1)
+def _default_parser() -> ImageParser:
+    # One parser per process keeps the Mistral client's HTTP connection pool
+    # (and the diskcache handle) warm across uploads and reruns.
+    return ImageParser()
+
+
 def parse_image_bytes(data: bytes, parser: ImageParser | None = None) -> list[str]:
-    return (parser or ImageParser()).parse_bytes(data)
+    return (parser or _default_parser()).parse_bytes(data)
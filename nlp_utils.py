@@ -32,6 +32,7 @@ def extract_ingredient_entities(text: str, model_path: str | None = None) -> lis
     return foods
 
 
+@lru_cache(maxsize=16384)
 def get_canonical_ingredient(text: str, model_path: str | None = None) -> str:
     food_ents = extract_ingredient_entities(text, model_path=model_path)
     return " ".join(food_ents) if food_ents else text.lower().strip()
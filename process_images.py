@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 # Python 3.12
 import base64
+import hashlib
 import json
 import logging
+import mmap
+import os
 import sys
 from pathlib import Path
 from typing import Literal
@@ -86,8 +89,12 @@ def chunk_list(items: list[object], size: int) -> list[list[object]]:
 
 
 def encode_image(path: str) -> str:
-    with open(path, "rb") as f:
-        b64 = base64.b64encode(f.read()).decode("utf-8")
+    # mmap refuses zero-length files, so an empty image encodes to no payload.
+    if os.path.getsize(path) == 0:
+        return "data:image/jpeg;base64,"
+    # Encode straight from the mapped file rather than a read() copy of it.
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        b64 = base64.b64encode(mm).decode("ascii")
     return f"data:image/jpeg;base64,{b64}"
 
 
@@ -141,7 +148,12 @@ class MistralInterface:
         reraise=True,
     )
     def parse_images(self, prompt: str, images: list[str]) -> list[OutputModel]:
-        key = f"{prompt}-{','.join(images)}"
+        # Hash rather than store the full base64 payloads as the cache key.
+        digest = hashlib.sha256(f"{self.model}:{prompt}".encode("utf-8"))
+        for img in images:
+            digest.update(b"\0")
+            digest.update(img.encode("utf-8"))
+        key = digest.hexdigest()
         if cached := self.cache.get(key):
             return [OutputModel.model_validate(item) for item in cached]
 
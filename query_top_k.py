@@ -3,6 +3,8 @@ import logging
 import os
 import re
 import sqlite3
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -12,7 +14,7 @@ from rapidfuzz.process import cdist
 from scipy.optimize import linear_sum_assignment
 
 from nlp_utils import get_canonical_ingredient
-from constants import ConfigKeys, PathName, NumericDefault
+from constants import ConfigKeys, DbKeys, PathName, NumericDefault
 
 
 
@@ -29,9 +31,22 @@ def get_db_path() -> str:
     )
 
 
-def get_db_connection(db_path: str | None = None) -> sqlite3.Connection:
+def get_db_connection(
+    db_path: str | None = None,
+    cached_statements: int = 128,
+    read_only: bool = False,
+    check_same_thread: bool = True,
+) -> sqlite3.Connection:
     """Return an SQLite connection with a REGEXP helper."""
-    conn = sqlite3.connect(db_path or get_db_path())
+    db_path = db_path or get_db_path()
+    if read_only:
+        db_path = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(
+        db_path,
+        cached_statements=cached_statements,
+        check_same_thread=check_same_thread,
+        uri=read_only,
+    )
     conn.create_function(
         "REGEXP",
         2,
@@ -42,14 +57,82 @@ def get_db_connection(db_path: str | None = None) -> sqlite3.Connection:
     return conn
 
 
+_QUERY_CONN_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+_query_conn_lock = threading.Lock()
+_query_conns: dict[str, tuple[tuple[int, int, int], sqlite3.Connection]] = {}
+
+
+def _fetch_all(sql: str, params: list) -> list[tuple]:
+    """
+    Run a read query on the process-wide connection to the recipe DB.
+    Streamlit runs every rerun on a fresh thread, so the connection is
+    shared across threads and the lock covers both execute and fetch.
+    It is reopened when the file changes, as a Drive sync rewrites the
+    DB in place; RECIPE_DB_PATH is resolved on every call.
+    """
+    db_path = get_db_path()
+    stat = os.stat(db_path)
+    stamp = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    with _query_conn_lock:
+        cached = _query_conns.get(db_path)
+        if cached is not None and cached[0] == stamp:
+            conn = cached[1]
+        else:
+            if cached is not None:
+                cached[1].close()
+            conn = get_db_connection(
+                db_path, cached_statements=256, read_only=True, check_same_thread=False
+            )
+            for pragma in _QUERY_CONN_PRAGMAS:
+                conn.execute(pragma)
+            _query_conns[db_path] = (stamp, conn)
+        return conn.execute(sql, params).fetchall()
+
+
+def ensure_recipe_indexes(db_path: str | None = None) -> None:
+    """
+    Create the ingredient lookup index build_candidate_urls relies on.
+    It lets the ingredient IN (...) filter seek straight to matching rows
+    instead of probing every recipe's ingredients.
+    """
+    db_path = db_path or get_db_path()
+    if not os.path.exists(db_path):
+        logging.warning(f"Recipe DB not found, skipping index creation: {db_path}")
+        return
+    # mode=rw never creates the file, so a DB removed since the check above
+    # fails here instead of leaving an empty recipes.db behind.
+    try:
+        conn = sqlite3.connect(f"{Path(db_path).resolve().as_uri()}?mode=rw", uri=True)
+    except sqlite3.Error as e:
+        logging.warning(f"Could not open recipe DB for indexing: {e}")
+        return
+    try:
+        conn.execute(DbKeys.SQL_CREATE_INGREDIENT_INDEX)
+        conn.commit()
+    except sqlite3.Error as e:
+        logging.warning(f"Could not create recipe ingredient index: {e}")
+    finally:
+        conn.close()
+
+
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=16384)
 def normalize_ingredient_name(text: str) -> str:
     """
     Lowercase, remove punctuation, collapse multiple spaces.
     Matches how we stored 'normalized_ingredient' in DB.
     """
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s]", "", text)
-    text = re.sub(r"\s+", " ", text)
+    text = _PUNCT_RE.sub("", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     return text
 
 
@@ -75,7 +158,11 @@ def deduplicate_candidates(
     ])
 
     sim_matrix = cdist(
-        candidate_titles, candidate_titles, scorer=fuzz.token_set_ratio
+        candidate_titles,
+        candidate_titles,
+        scorer=fuzz.token_set_ratio,
+        score_cutoff=threshold,
+        workers=-1,
     )
 
     lengths = np.array([len(json.dumps(recipes_dict[url])) for url in candidate_urls])
@@ -299,9 +386,7 @@ def build_candidate_urls(
     logging.info(f"Final SQL:\n{sql}")
     logging.info(f"Params: {final_params}")
 
-    conn = get_db_connection()
-    rows = conn.execute(sql, final_params).fetchall()
-    conn.close()
+    rows = _fetch_all(sql, final_params)
 
     return [(r[0], r[1]) for r in rows]
 
@@ -318,24 +403,25 @@ def load_bulk_recipes(candidate_urls: list[str]) -> dict[str, dict]:
 
     query = f"""
         SELECT
-            url,
-            title,
-            cook_time,
-            yields,
-            description,
-            why_this_works,
-            headnote,
-            equipment,
-            processed_at,
-            course,
-            main_ingredient
-        FROM recipe_schema
-        WHERE url IN ({placeholders})
-        ORDER BY url
+            s.url,
+            s.title,
+            s.cook_time,
+            s.yields,
+            s.description,
+            s.why_this_works,
+            s.headnote,
+            s.equipment,
+            s.processed_at,
+            s.course,
+            s.main_ingredient,
+            sr.simplified_data
+        FROM recipe_schema s
+        LEFT JOIN simplified_recipes sr
+          ON sr.url = s.url
+        WHERE s.url IN ({placeholders})
+        ORDER BY s.url
     """
-    conn = get_db_connection()
-    recipe_rows = conn.execute(query, candidate_urls).fetchall()
-    conn.close()
+    recipe_rows = _fetch_all(query, candidate_urls)
 
     recipes = {}
     for row in recipe_rows:
@@ -351,7 +437,13 @@ def load_bulk_recipes(candidate_urls: list[str]) -> dict[str, dict]:
             processed_at,
             course,
             main_ingredient,
+            simplified_data,
         ) = row
+        try:
+            simplified = json.loads(simplified_data) if simplified_data else {}
+        except Exception as e:
+            simplified = {}
+            logging.error(f"Error decoding simplified_data for {url}: {e}")
         recipes[url] = {
             "url": url,
             "title": title or "",
@@ -366,7 +458,7 @@ def load_bulk_recipes(candidate_urls: list[str]) -> dict[str, dict]:
             "main_ingredient": main_ingredient,
             "ingredients": [],
             "instructions": [],
-            "simplified_data": {},
+            "simplified_data": simplified,
         }
 
     query_ing = f"""
@@ -379,9 +471,7 @@ def load_bulk_recipes(candidate_urls: list[str]) -> dict[str, dict]:
         WHERE url IN ({placeholders})
         ORDER BY url
     """
-    conn = get_db_connection()
-    ing_rows = conn.execute(query_ing, candidate_urls).fetchall()
-    conn.close()
+    ing_rows = _fetch_all(query_ing, candidate_urls)
 
     for row in ing_rows:
         url, ingredient, norm_ing, can_ing = row
@@ -403,9 +493,7 @@ def load_bulk_recipes(candidate_urls: list[str]) -> dict[str, dict]:
         WHERE url IN ({placeholders})
         ORDER BY url, step_number
     """
-    conn = get_db_connection()
-    instr_rows = conn.execute(query_instr, candidate_urls).fetchall()
-    conn.close()
+    instr_rows = _fetch_all(query_instr, candidate_urls)
 
     for row in instr_rows:
         url, step_number, instruction = row
@@ -414,29 +502,6 @@ def load_bulk_recipes(candidate_urls: list[str]) -> dict[str, dict]:
                 {"step_number": step_number, "instruction": instruction}
             )
 
-    query_simplified = f"""
-        SELECT
-            url,
-            simplified_data
-        FROM simplified_recipes
-        WHERE url IN ({placeholders})
-        ORDER BY url
-    """
-    conn = get_db_connection()
-    simp_rows = conn.execute(query_simplified, candidate_urls).fetchall()
-    conn.close()
-
-    for row in simp_rows:
-        url, simplified_data = row
-        if url in recipes:
-            try:
-                recipes[url]["simplified_data"] = (
-                    json.loads(simplified_data) if simplified_data else {}
-                )
-            except Exception as e:
-                recipes[url]["simplified_data"] = {}
-                logging.error(f"Error decoding simplified_data for {url}: {e}")
-
     return recipes
 
 
@@ -512,42 +577,26 @@ def bulk_compute_coverage(
         sim_sub = combined_sim_matrix[:, start_can:end_can]
 
         recipe_best_sims = np.max(sim_sub, axis=0)
-        frac_recipe_covered = sum(1 for s in recipe_best_sims if s >= min_pair_sim) / M
+        frac_recipe_covered = np.count_nonzero(recipe_best_sims >= min_pair_sim) / M
 
         if frac_recipe_covered < skip_hungarian_threshold:
             user_best_sims = np.max(sim_sub, axis=1)
-            frac_user_covered = sum(1 for s in user_best_sims if s >= min_pair_sim) / N
+            frac_user_covered = np.count_nonzero(user_best_sims >= min_pair_sim) / N
 
             results.append((url, title, frac_user_covered, frac_recipe_covered))
             continue
 
-        sim_sub_copy = sim_sub.copy()
-        sim_sub_copy[sim_sub_copy < min_pair_sim] = 0.0
-        cost_matrix = 1.0 - sim_sub_copy
+        sim_sub_copy = np.where(sim_sub >= min_pair_sim, sim_sub, 0.0)
         max_dim = max(N, M)
-        if N < max_dim:
-            cost_matrix = np.vstack(
-                [cost_matrix, np.ones((max_dim - N, M), dtype=cost_matrix.dtype)]
-            )
-        if M < max_dim:
-            cost_matrix = np.hstack(
-                [cost_matrix, np.ones((max_dim, max_dim - M), dtype=cost_matrix.dtype)]
-            )
+        cost_matrix = np.ones((max_dim, max_dim), dtype=sim_sub_copy.dtype)
+        cost_matrix[:N, :M] = 1.0 - sim_sub_copy
         row_ind, col_ind = linear_sum_assignment(cost_matrix)
 
-        matched_scores = []
-        matched_columns = set()
-        for r_idx, c_idx in zip(row_ind, col_ind):
-            if r_idx < N and c_idx < M:
-                val = sim_sub_copy[r_idx, c_idx]
-                matched_scores.append(val)
-                if val > 0.0:
-                    matched_columns.add(c_idx)
-            else:
-                matched_scores.append(0.0)
-        final_score = sum(matched_scores) / M
-        matched_user = sum(1 for s in matched_scores if s > 0)
-        user_coverage = matched_user / N
+        # Pairs that land in the padding contribute a score of 0.
+        real = (row_ind < N) & (col_ind < M)
+        matched_scores = sim_sub_copy[row_ind[real], col_ind[real]]
+        final_score = matched_scores.sum() / M
+        user_coverage = np.count_nonzero(matched_scores > 0) / N
 
         results.append((url, title, user_coverage, final_score))
     return results
@@ -642,8 +691,12 @@ def query_top_k(
             recipes_dict,
             threshold=NumericDefault.DEDUP_THRESHOLD,
         )
-    candidate_urls = [c[0] for c in deduped_candidates]
-    recipes_dict = load_bulk_recipes(candidate_urls)
+    # Every deduped candidate was loaded above; keep those rather than
+    # querying the same recipes again.
+    kept_urls = {c[0] for c in deduped_candidates}
+    recipes_dict = {
+        url: recipe for url, recipe in recipes_dict.items() if url in kept_urls
+    }
 
     cov_results = bulk_compute_coverage(
         recipes_dict=recipes_dict,
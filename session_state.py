@@ -6,14 +6,17 @@ class SessionStateKeys(StrEnum):
 
     SIMPLE_SEARCH_RESULTS_HTML = "simple_search_results_html"
     SIMPLE_SEARCH_MAPPING = "simple_search_mapping"
+    SIMPLE_SEARCH_LABEL_INDEX = "simple_search_label_index"
     SIMPLE_SEARCH_RESULTS_DF = "simple_search_results_df"
     SIMPLE_SELECTED_RECIPE_LABEL = "simple_selected_recipe_label"
 
     ADVANCED_SEARCH_RESULTS_HTML = "adv_search_results_html"
     ADVANCED_SEARCH_MAPPING = "adv_search_mapping"
+    ADVANCED_SEARCH_LABEL_INDEX = "adv_search_label_index"
     ADVANCED_SELECTED_RECIPE_LABEL = "adv_selected_recipe_label"
     ADVANCED_SEARCH_RESULTS_DF = "adv_search_results_df"
 
+    SESSION_INITIALIZED = "session_initialized"
     SELECTED_PAGE = "selected_page"
     LOADED_INGREDIENTS_TEXT = "loaded_ingredients_text"
     LOADED_EXCLUDED_TEXT = "loaded_excluded_text"
@@ -65,4 +68,6 @@ class SessionStateKeys(StrEnum):
 
     ALL_SOURCES_LIST = "all_sources_list"
     LIBRARY_BOOK_MAPPING = "library_book_mapping"
+    LIBRARY_BOOK_LABELS = "library_book_labels"
     PROFILE_STATUS_MESSAGE = "profile_status_message"
+    LAST_SAVED_PROFILE_HASH = "last_saved_profile_hash"
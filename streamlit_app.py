@@ -1,14 +1,15 @@
 import logging
-from datetime import datetime
+import os
 
 import streamlit as st
 
 from cache_manager import fetch_db_last_updated
 from config import CONFIG
-from constants import FormatStrings, LogMsg
+from constants import LogMsg
 from db_utils import init_profile_db, fetch_sources_cached
 from gdrive_utils import download_essential_files, list_drive_books_cached
 from log_utils import ErrorPayload, log_with_payload
+from query_top_k import ensure_recipe_indexes, get_db_path
 from session_state import SessionStateKeys
 from ui_helpers import UiText
 from ui_pages.advanced_search import render_advanced_search_page
@@ -17,31 +18,6 @@ from ui_pages.simple_search import render_simple_search_page
 
 st.set_page_config(layout="wide", page_title=UiText.PAGE_TITLE)
 
-
-st.markdown(
-    """
-    <style>
-      /* Style both our custom button and any Streamlit “Open Book PDF” button */
-      button[title="Open Book PDF"], #openBtn {
-        background-color: var(--primary-color) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 4px !important;
-        font-size: 14px !important;
-        font-weight: 600 !important;
-        padding: 0.5em 1em !important;
-        max-width: 180px !important;
-        cursor: pointer !important;
-      }
-      button[title="Open Book PDF"]:hover,
-      #openBtn:hover {
-        background-color: var(--primary-color-dark) !important;
-      }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
-
 default_tag_filter_mode_enum = CONFIG._validated_default_tag_filter_mode
 
 logging.basicConfig(
@@ -50,23 +26,35 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-download_essential_files()
 
-init_profile_db()
+# The TTL keeps the MD5 sync with Drive running, so a new recipes.db still
+# reaches a live app and a boot that hit a Drive error is retried.
+@st.cache_resource(ttl=600, show_spinner=False)
+def _bootstrap() -> bool:
+    """Sync essential files from Drive and prepare the databases."""
+    download_essential_files()
+    # Raising keeps cache_resource from caching a failed boot, so the next
+    # rerun retries the download instead of serving an app without recipes.
+    db_path = get_db_path()
+    if not os.path.exists(db_path):
+        log_with_payload(logging.ERROR, LogMsg.RECIPE_DB_MISSING, db_path=db_path)
+        raise FileNotFoundError(f"Recipe DB not found: {db_path}")
+    ensure_recipe_indexes()
+    init_profile_db()
+    return True
+
+
+_bootstrap()
 
 
 def initialize_session_state():
     """Initializes Streamlit session state with default values."""
+    if st.session_state.get(SessionStateKeys.SESSION_INITIALIZED):
+        return
 
     default_sources = []
     try:
-        db_update_time = fetch_db_last_updated()
-        cache_key_time = (
-            db_update_time.strftime(FormatStrings.TIMESTAMP_CACHE_KEY)
-            if isinstance(db_update_time, datetime)
-            else str(db_update_time)
-        )
-        all_sources = fetch_sources_cached(cache_key_time)
+        all_sources = fetch_sources_cached(fetch_db_last_updated())
         valid_sources = [s for s in all_sources if s != UiText.ERROR_SOURCES_DISPLAY]
         st.session_state[SessionStateKeys.ALL_SOURCES_LIST] = valid_sources
         default_sources = valid_sources
@@ -87,6 +75,8 @@ def initialize_session_state():
 
     try:
         book_labels, book_mapping = list_drive_books_cached()
+        # Both are the cached resource's own objects, shared rather than copied.
+        st.session_state[SessionStateKeys.LIBRARY_BOOK_LABELS] = book_labels
         st.session_state[SessionStateKeys.LIBRARY_BOOK_MAPPING] = book_mapping
     except Exception as e:
         err_payload = ErrorPayload(error_message=str(e))
@@ -98,6 +88,7 @@ def initialize_session_state():
             exc_info=True,
         )
         st.error(UiText.ERROR_BOOKS_LOAD_FAIL.format(error=e))
+        st.session_state[SessionStateKeys.LIBRARY_BOOK_LABELS] = []
         st.session_state[SessionStateKeys.LIBRARY_BOOK_MAPPING] = {}
 
     defaults = CONFIG.defaults
@@ -130,8 +121,8 @@ def initialize_session_state():
         SessionStateKeys.LOADED_EXCLUDE_CUISINE_FILTER: [],
         SessionStateKeys.LOADED_TAG_FILTER_MODE: default_tag_filter_mode_enum,
         SessionStateKeys.LOADED_MAX_STEPS: defaults.max_steps,
-        SessionStateKeys.LOADED_USER_COVERAGE: defaults.user_coverage * 100.0,
-        SessionStateKeys.LOADED_RECIPE_COVERAGE: defaults.recipe_coverage * 100.0,
+        SessionStateKeys.LOADED_USER_COVERAGE: defaults.user_coverage_pct,
+        SessionStateKeys.LOADED_RECIPE_COVERAGE: defaults.recipe_coverage_pct,
         SessionStateKeys.LOADED_SOURCES: default_sources,
         SessionStateKeys.PROFILE_STATUS_MESSAGE: defaults.profile_message,
     }
@@ -140,44 +131,35 @@ def initialize_session_state():
         if key not in st.session_state:
             st.session_state[key] = default_value
 
+    st.session_state[SessionStateKeys.SESSION_INITIALIZED] = True
 
-initialize_session_state()
-
-
-page_options = [
-    UiText.TAB_ABOUT,
-    UiText.TAB_ADVANCED,
-    UiText.TAB_SIMPLE,
-    UiText.TAB_LIBRARY,
-]
 
-st.sidebar.radio(
-    UiText.SIDEBAR_PAGE_SELECT,
-    options=page_options,
-    key=SessionStateKeys.SELECTED_PAGE,
-)
+initialize_session_state()
 
-if st.session_state[SessionStateKeys.SELECTED_PAGE] == UiText.TAB_ABOUT:
-    st.markdown(UiText.ABOUT_MARKDOWN)
 
-elif st.session_state[SessionStateKeys.SELECTED_PAGE] == UiText.TAB_ADVANCED:
-    render_advanced_search_page(
+_PAGE_DISPATCH = {
+    UiText.TAB_ABOUT: lambda: st.markdown(UiText.ABOUT_MARKDOWN),
+    UiText.TAB_ADVANCED: lambda: render_advanced_search_page(
         st,
         CONFIG,
         default_tag_filter_mode_enum,
-    )
-
-
-elif st.session_state[SessionStateKeys.SELECTED_PAGE] == UiText.TAB_SIMPLE:
-    render_simple_search_page(
+    ),
+    UiText.TAB_SIMPLE: lambda: render_simple_search_page(
         st,
         CONFIG,
-    )
-
-elif st.session_state[SessionStateKeys.SELECTED_PAGE] == UiText.TAB_LIBRARY:
-    render_library_page(
+    ),
+    UiText.TAB_LIBRARY: lambda: render_library_page(
         st,
         CONFIG,
-    )
+    ),
+}
+
+st.sidebar.radio(
+    UiText.SIDEBAR_PAGE_SELECT,
+    options=list(_PAGE_DISPATCH),
+    key=SessionStateKeys.SELECTED_PAGE,
+)
+
+_PAGE_DISPATCH[st.session_state[SessionStateKeys.SELECTED_PAGE]]()
 
 log_with_payload(logging.INFO, LogMsg.SCRIPT_EXEC_FINISHED)
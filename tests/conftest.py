@@ -0,0 +1,25 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+os.environ["RECIPE_DB_PATH"] = str(ROOT / "data" / "test_recipes.db")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "network: needs the Supabase API or Postgres to be reachable"
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_nlp():
+    """Load the spaCy model once, before the first timed test."""
+    from nlp_utils import get_nlp
+
+    # Same call shape as extract_ingredient_entities, so its lru_cache entry is hit.
+    get_nlp(None)
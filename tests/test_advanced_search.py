@@ -0,0 +1,130 @@
+import base64
+import json
+
+import pytest
+
+AppTest = pytest.importorskip("streamlit.testing.v1").AppTest
+
+import ui_pages.advanced_search as advanced_search
+from constants import ProfileDataKeys, ProfileWireKeys, ProfileWireVersion
+from session_state import SessionStateKeys
+from ui_helpers import UiText
+
+
+def _advanced_page():
+    import streamlit as st
+
+    from config import CONFIG
+    from ui_pages.advanced_search import render_advanced_search_page
+
+    render_advanced_search_page(st, CONFIG, CONFIG._validated_default_tag_filter_mode)
+
+
+@pytest.fixture
+def profile_rows(monkeypatch):
+    """In-memory profile table; the newest row per user is last."""
+    rows: dict[str, list[str]] = {}
+
+    def fake_save_profile(username: str, options_base64: str) -> str:
+        rows.setdefault(username, []).append(options_base64)
+        return str(len(rows[username]))
+
+    def fake_load_profile(username: str):
+        if not rows.get(username):
+            return None
+        return {
+            ProfileDataKeys.TIMESTAMP: str(len(rows[username])),
+            ProfileDataKeys.OPTIONS: json.loads(base64.b64decode(rows[username][-1])),
+        }
+
+    monkeypatch.setattr(advanced_search, "save_profile", fake_save_profile)
+    monkeypatch.setattr(advanced_search, "load_profile", fake_load_profile)
+    return rows
+
+
+def _open_page(username: str, ingredients: str) -> AppTest:
+    at = AppTest.from_function(_advanced_page, default_timeout=60).run()
+    at.text_input(key=SessionStateKeys.USERNAME_INPUT).input(username)
+    at.text_area(key=SessionStateKeys.ADV_INGREDIENTS_INPUT).input(ingredients)
+    return at.run()
+
+
+def _click(at: AppTest, label: str) -> None:
+    next(b for b in at.button if b.label == label).click().run()
+    assert not at.exception
+
+
+def _stored_ingredients(rows: dict[str, list[str]], username: str) -> str:
+    stored = json.loads(base64.b64decode(rows[username][-1]))
+    return advanced_search._options_from_wire(stored)[ProfileDataKeys.INGREDIENTS_TEXT]
+
+
+def test_save_after_loading_newer_profile_is_not_skipped(profile_rows):
+    device_a = _open_page("alice", "egg")
+    _click(device_a, UiText.BUTTON_SAVE_PROFILE)
+    _click(device_a, UiText.BUTTON_SAVE_PROFILE)
+    assert len(profile_rows["alice"]) == 1
+
+    device_b = _open_page("alice", "milk")
+    _click(device_b, UiText.BUTTON_SAVE_PROFILE)
+    assert _stored_ingredients(profile_rows, "alice") == "milk"
+
+    _click(device_a, UiText.BUTTON_LOAD_PROFILE)
+    device_a.text_area(key=SessionStateKeys.ADV_INGREDIENTS_INPUT).input("egg").run()
+    _click(device_a, UiText.BUTTON_SAVE_PROFILE)
+    assert _stored_ingredients(profile_rows, "alice") == "egg"
+
+
+def test_unchanged_save_after_other_device_save_is_written(profile_rows):
+    device_a = _open_page("alice", "egg")
+    _click(device_a, UiText.BUTTON_SAVE_PROFILE)
+
+    device_b = _open_page("alice", "milk")
+    _click(device_b, UiText.BUTTON_SAVE_PROFILE)
+    assert _stored_ingredients(profile_rows, "alice") == "milk"
+
+    _click(device_a, UiText.BUTTON_SAVE_PROFILE)
+    assert len(profile_rows["alice"]) == 3
+    assert _stored_ingredients(profile_rows, "alice") == "egg"
+
+
+def test_reset_clears_last_saved_hash(profile_rows):
+    at = _open_page("alice", "egg")
+    _click(at, UiText.BUTTON_SAVE_PROFILE)
+    assert SessionStateKeys.LAST_SAVED_PROFILE_HASH in at.session_state
+
+    _click(at, UiText.BUTTON_RESET_FIELDS)
+    assert SessionStateKeys.LAST_SAVED_PROFILE_HASH not in at.session_state
+
+
+def test_profile_options_round_trip_through_wire_keys():
+    options = {
+        profile_key: f"{profile_key} value"
+        for profile_key, _, _ in advanced_search._PROFILE_SAVE_FIELDS
+    }
+    options[ProfileDataKeys.MIN_ING_MATCHES] = 2
+    options[ProfileDataKeys.RECIPE_COVERAGE_SLIDER] = 37.5
+    options[ProfileDataKeys.CUISINE_FILTER] = ["Italian", "Thai"]
+
+    wire = json.loads(json.dumps(advanced_search._options_to_wire(options)))
+    assert wire[ProfileWireKeys.VERSION] == ProfileWireVersion.COMPACT
+    assert ProfileDataKeys.INGREDIENTS_TEXT not in wire
+    assert advanced_search._options_from_wire(wire) == options
+
+
+def test_legacy_long_key_profile_loads_unchanged(profile_rows):
+    legacy = {
+        ProfileDataKeys.INGREDIENTS_TEXT.value: "flour\nbutter",
+        ProfileDataKeys.MAX_STEPS.value: 7,
+        ProfileDataKeys.TAG_FILTER_MODE.value: "OR",
+        ProfileDataKeys.CUISINE_FILTER.value: ["French"],
+    }
+    assert advanced_search._options_from_wire(legacy) is legacy
+
+    profile_rows["bob"] = [base64.b64encode(json.dumps(legacy).encode()).decode()]
+    at = _open_page("bob", "")
+    _click(at, UiText.BUTTON_LOAD_PROFILE)
+    assert at.session_state[SessionStateKeys.LOADED_INGREDIENTS_TEXT] == "flour\nbutter"
+    assert at.session_state[SessionStateKeys.LOADED_MAX_STEPS] == 7
+    assert at.session_state[SessionStateKeys.LOADED_TAG_FILTER_MODE] == "OR"
+    assert at.session_state[SessionStateKeys.LOADED_CUISINE_FILTER] == ["French"]
@@ -1,15 +1,21 @@
 from types import SimpleNamespace
 import sys
-from pathlib import Path
 import pytest
 
 sys.modules.setdefault("streamlit", SimpleNamespace(secrets={}))
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 import image_parser
 from process_images import OutputModel, MistralInterface
 
 
+@pytest.fixture(autouse=True)
+def _stub_streamlit_secrets(monkeypatch):
+    # ImageParser reads st.secrets at construction; keep the stub even when
+    # another test module has already imported the real streamlit.
+    monkeypatch.setitem(sys.modules, "streamlit", SimpleNamespace(secrets={}))
+    image_parser._default_parser.cache_clear()
+
+
 def test_parse_image_bytes_returns_lowercased(monkeypatch):
     def fake_parse_images(self, prompt: str, images: list[str]):
         return [
@@ -0,0 +1,21 @@
+import base64
+from types import SimpleNamespace
+import sys
+
+sys.modules.setdefault("streamlit", SimpleNamespace(secrets={}))
+
+from process_images import encode_image
+
+
+def test_encode_image_matches_plain_read(tmp_path):
+    data = b"\xff\xd8\xff\xe0 not really a jpeg"
+    path = tmp_path / "photo.jpg"
+    path.write_bytes(data)
+    expected = "data:image/jpeg;base64," + base64.b64encode(data).decode()
+    assert encode_image(str(path)) == expected
+
+
+def test_encode_image_handles_empty_file(tmp_path):
+    path = tmp_path / "empty.jpg"
+    path.touch()
+    assert encode_image(str(path)) == "data:image/jpeg;base64,"
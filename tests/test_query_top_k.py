@@ -1,11 +1,6 @@
-import os
-import sys
-from pathlib import Path
-
-ROOT = Path(__file__).resolve().parents[1]
-sys.path.append(str(ROOT))
-
-os.environ["RECIPE_DB_PATH"] = str(ROOT / "data" / "test_recipes.db")
+import shutil
+import sqlite3
+from functools import lru_cache
 
 import pytest
 
@@ -19,6 +14,18 @@ from query_top_k import (
 from nlp_utils import get_canonical_ingredient
 
 
+@lru_cache(maxsize=128)
+def _cached_query(keywords, user_ingredients, min_ing_matches, top_n_db):
+    return query_top_k.query_top_k(
+        user_ingredients=list(user_ingredients),
+        tag_filters={},
+        excluded_tags={},
+        keywords_to_include=list(keywords),
+        min_ing_matches=min_ing_matches,
+        top_n_db=top_n_db,
+    )
+
+
 def run_query(keywords=None, user_ingredients=None, min_ing_matches=None, top_n_db=10):
     if keywords is None:
         keywords = []
@@ -26,21 +33,24 @@ def run_query(keywords=None, user_ingredients=None, min_ing_matches=None, top_n_
         user_ingredients = []
     if min_ing_matches is None:
         min_ing_matches = 1 if user_ingredients else 0
-    return query_top_k.query_top_k(
-        user_ingredients=user_ingredients,
-        tag_filters={},
-        excluded_tags={},
-        keywords_to_include=keywords,
-        min_ing_matches=min_ing_matches,
-        top_n_db=top_n_db,
+    return _cached_query(
+        tuple(keywords), tuple(user_ingredients), min_ing_matches, top_n_db
     )
 
 
 @pytest.mark.parametrize(
     "keywords, expected",
-    [(["steak"], True), (["tea"], False), (["mussels"], True)],
+    [
+        (["steak"], True),
+        (["tea"], False),
+        (["mussels"], True),
+        # Fragments of longer words must not match (garlic, watercress, steam).
+        (["gar"], False),
+        (["cress"], False),
+        (["team"], False),
+    ],
 )
-def test_keyword_basic(keywords, expected):
+def test_keyword_behavior(keywords, expected):
     results = run_query(keywords=keywords)
     assert (len(results) > 0) == expected
 
@@ -60,21 +70,28 @@ def test_query_specific_recipe():
     assert any("italian-beef-sandwiches" in r["url"] for r in results)
 
 
-def test_build_candidate_urls():
-    ingredients = ["garlic clove", "boneless beef chuckeye roast"]
-    norm = [normalize_ingredient_name(i) for i in ingredients]
-    cands = build_candidate_urls({}, {}, norm, min_ing_matches=2, limit=20)
-    urls = [u for u, _ in cands]
+BEEF_INGREDIENTS = ["boneless beef chuck-eye roast", "garlic clove"]
+
+
+@pytest.fixture(scope="module")
+def beef_norm():
+    return [normalize_ingredient_name(i) for i in BEEF_INGREDIENTS]
+
+
+@pytest.fixture(scope="module")
+def beef_candidates(beef_norm):
+    return build_candidate_urls({}, {}, beef_norm, min_ing_matches=2, limit=20)
+
+
+def test_build_candidate_urls(beef_candidates):
+    urls = [u for u, _ in beef_candidates]
     assert any("italian-beef-sandwiches" in u for u in urls)
 
 
-def test_bulk_compute_coverage():
-    ingredients = ["boneless beef chuck-eye roast", "garlic clove"]
-    norm = [normalize_ingredient_name(i) for i in ingredients]
-    cands = build_candidate_urls({}, {}, norm, min_ing_matches=2, limit=5)
-    urls = [u for u, _ in cands]
+def test_bulk_compute_coverage(beef_candidates):
+    urls = [u for u, _ in beef_candidates[:5]]
     recipes = query_top_k.load_bulk_recipes(urls)
-    coverage = bulk_compute_coverage(recipes, ingredients, min_pair_sim=0.9)
+    coverage = bulk_compute_coverage(recipes, BEEF_INGREDIENTS, min_pair_sim=0.9)
     for url, title, uc, rc in coverage:
         if "italian-beef-sandwiches" in url:
             assert uc == 1.0
@@ -122,14 +139,6 @@ def test_query_italian_beef_result():
     assert results and results[0]["url"].endswith("chicago-italian-beef-sandwiches")
 
 
-@pytest.mark.parametrize(
-    "keywords",
-    [["gar"], ["cress"], ["team"]],
-)
-def test_keyword_no_partial_matches(keywords):
-    assert run_query(keywords=keywords) == []
-
-
 @pytest.mark.parametrize(
     "ingredients, min_match, expect_any",
     [
@@ -157,4 +166,23 @@ def test_many_ingredients_match():
         "soy sauce",
     ]
     results = run_query(user_ingredients=ingredients, min_ing_matches=10, top_n_db=10)
-    assert results and results[0]["url"].endswith("chili-crisp-noodles")
\ No newline at end of file
+    assert results and results[0]["url"].endswith("chili-crisp-noodles")
+
+
+def test_ensure_recipe_indexes_skips_missing_db(tmp_path):
+    db_path = tmp_path / "recipes.db"
+    query_top_k.ensure_recipe_indexes(str(db_path))
+    assert not db_path.exists()
+
+
+def test_ensure_recipe_indexes_creates_ingredient_index(tmp_path):
+    db_path = tmp_path / "recipes.db"
+    shutil.copy(query_top_k.get_db_path(), db_path)
+    query_top_k.ensure_recipe_indexes(str(db_path))
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        names = {name for (name,) in rows}
+    finally:
+        conn.close()
+    assert "idx_recipe_ingredients_normalized" in names
@@ -1,21 +1,18 @@
-import sys
-from pathlib import Path
-
 from dotenv import load_dotenv
 import psycopg2
 import pytest
 from supabase import create_client
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-
 load_dotenv()
 
 from config import CONFIG
 from constants import DbKeys
 from scripts.setup_supabase import MigrationConfig, create_table_if_missing
 
+pytestmark = pytest.mark.network
+
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def supabase_client() -> object:
     if not CONFIG.supabase_url or not CONFIG.supabase_api_key:
         pytest.skip("Supabase credentials not configured")
@@ -24,21 +21,25 @@ def supabase_client() -> object:
         if CONFIG.supabase_db_url:
             cfg = MigrationConfig()
             create_table_if_missing(cfg)
-        client.table(DbKeys.TABLE_USER_PROFILES).select("id").limit(1).execute()
+        client.table(DbKeys.TABLE_USER_PROFILES).select(
+            "id", head=True
+        ).limit(1).execute()
         return client
     except Exception as exc:  # pragma: no cover - network error handling
         pytest.skip(f"Supabase not reachable: {exc}")
 
 
 def test_supabase_api_reachable(supabase_client: object) -> None:
-    supabase_client.table(DbKeys.TABLE_USER_PROFILES).select("*").limit(1).execute()
+    supabase_client.table(DbKeys.TABLE_USER_PROFILES).select(
+        "*", head=True
+    ).limit(1).execute()
 
 
 def test_postgres_connection() -> None:
     if not CONFIG.supabase_db_url:
         pytest.skip("Supabase DB URL not configured")
     try:
-        with psycopg2.connect(CONFIG.supabase_db_url) as conn:
+        with psycopg2.connect(CONFIG.supabase_db_url, connect_timeout=5) as conn:
             with conn.cursor() as cur:
                 cur.execute("SELECT 1")
                 assert cur.fetchone() == (1,)
@@ -1,15 +1,14 @@
-import base64
 import logging
-from enum import StrEnum
+import math
 from typing import Any
 
-from streamlit.components import v1 as components
-
 from constants import RecipeKeys, MiscValues, LogMsg
 from log_utils import ErrorPayload, log_with_payload
 
+_URL_SCHEMES: tuple[str, ...] = (MiscValues.HTTP_PREFIX, MiscValues.HTTPS_PREFIX)
+
 
-class UiText(StrEnum):
+class UiText:
     """Static UI text elements like labels, titles, messages."""
 
     WARNING_NO_INGREDIENTS_FROM_IMAGE = "No ingredients found."
@@ -19,7 +18,7 @@ class UiText(StrEnum):
     LABEL_FILE_INPUT = "…or upload an image"
     LABEL_CAMERA_INPUT = "Take a picture"
     
-    BUTTON_OPEN_BOOK_PDF = "Open Book PDF"
+    BUTTON_DOWNLOAD_BOOK_PDF = "Download Book PDF"
     PAGE_TITLE = "Recipe Finder"
     TAB_ABOUT = "About"
     TAB_ADVANCED = "Advanced Search"
@@ -127,6 +126,7 @@ class UiText(StrEnum):
         "<p style='color:orange;'>Please provide a username to load a profile.</p>"
     )
     PROFILE_MSG_SAVE_SUCCESS = "<p style='color:green;'>Profile '{username}' saved successfully at {timestamp}.</p>"
+    PROFILE_MSG_SAVE_UNCHANGED = "<p>Profile '{username}' has no changes since the last save.</p>"
     PROFILE_MSG_LOAD_SUCCESS = "<p style='color:green;'>Profile for '{username}' loaded (from {timestamp}).</p>"
     PROFILE_MSG_LOAD_NOT_FOUND = (
         "<p style='color:orange;'>No profile found for username '{username}'.</p>"
@@ -228,6 +228,34 @@ class UiText(StrEnum):
 
 
 
+def _instruction_step_key(instr: Any) -> float:
+    """Numeric step for sorting; missing or non-numeric steps sort last."""
+    if isinstance(instr, dict):
+        step = instr.get(RecipeKeys.STEP)
+        if step is not None:
+            try:
+                return float(step)
+            except (ValueError, TypeError):
+                pass
+    return math.inf
+
+
+def _append_section(
+    parts: list[str], data: dict[str, Any], key: str, title: str
+) -> None:
+    """Appends a titled Markdown section when data[key] is a non-empty string."""
+    content = data.get(key)
+    if content and isinstance(content, str):
+        parts.append(f"### {title}\n\n{content}\n\n")
+    elif content:
+        log_with_payload(
+            logging.WARNING,
+            LogMsg.RECIPE_SECTION_CONTENT_INVALID,
+            key=key,
+            type=type(content).__name__,
+        )
+
+
 def display_recipe_markdown(recipe_data: dict[str, Any]) -> str:
     """
     Builds a Markdown snippet for the full recipe details.
@@ -239,92 +267,79 @@ def display_recipe_markdown(recipe_data: dict[str, Any]) -> str:
         data = recipe_data
 
     if not isinstance(data, dict):
-        log_with_payload(
-            logging.ERROR, LogMsg.RECIPE_INVALID_DATA_TYPE, type=type(data)
-        )
+        type_name = type(data).__name__
+        log_with_payload(logging.ERROR, LogMsg.RECIPE_INVALID_DATA_TYPE, type=type_name)
 
-        return f"**Error:** Invalid recipe data format ({type(data)})."
+        return f"**Error:** Invalid recipe data format ({type_name})."
 
-    markdown_str = f"# {data.get(RecipeKeys.TITLE, UiText.DEFAULT_RECIPE_TITLE)}\n\n"
+    parts: list[str] = [
+        f"# {data.get(RecipeKeys.TITLE, UiText.DEFAULT_RECIPE_TITLE)}\n\n"
+    ]
 
-    def add_markdown_section(key: RecipeKeys, title: str) -> str:
-        content = data.get(key)
-        section_md = MiscValues.EMPTY
-        if content and isinstance(content, str):
-            section_md += f"### {title}\n\n"
-            section_md += f"{content}\n\n"
-        elif content:
-            log_with_payload(
-                logging.WARNING,
-                LogMsg.RECIPE_SECTION_CONTENT_INVALID,
-                key=key,
-                type=type(content),
-            )
-        return section_md
-
-    markdown_str += add_markdown_section(RecipeKeys.DESCRIPTION, "Description")
+    _append_section(parts, data, RecipeKeys.DESCRIPTION, "Description")
 
     cook_time = data.get(RecipeKeys.COOK_TIME)
 
     if cook_time:
-        markdown_str += f"### Cook Time\n\n{cook_time} minutes\n\n"
+        parts.append(f"### Cook Time\n\n{cook_time} minutes\n\n")
 
     yield_info = data.get(RecipeKeys.YIELD) or data.get(RecipeKeys.YIELDS)
     if yield_info:
-        markdown_str += f"### Yields\n\n{yield_info}\n\n"
+        parts.append(f"### Yields\n\n{yield_info}\n\n")
 
-    markdown_str += add_markdown_section(RecipeKeys.WHY_THIS_WORKS, "Why This Works")
-    markdown_str += add_markdown_section(RecipeKeys.HEADNOTE, "Headnote")
-    markdown_str += add_markdown_section(RecipeKeys.EQUIPMENT, "Equipment")
+    _append_section(parts, data, RecipeKeys.WHY_THIS_WORKS, "Why This Works")
+    _append_section(parts, data, RecipeKeys.HEADNOTE, "Headnote")
+    _append_section(parts, data, RecipeKeys.EQUIPMENT, "Equipment")
 
     ingredients = data.get(RecipeKeys.INGREDIENTS)
     if ingredients and isinstance(ingredients, list):
-        markdown_str += f"### Ingredients\n\n"
+        parts.append("### Ingredients\n\n")
+        # Bound once here; the attribute lookups add up on long lists.
+        quantity_key, measurement_key = RecipeKeys.QUANTITY, RecipeKeys.MEASUREMENT
+        ingredient_key, detail_key = RecipeKeys.INGREDIENT, RecipeKeys.DETAIL
+        empty, space = MiscValues.EMPTY, MiscValues.SPACE
         for ing in ingredients:
             if isinstance(ing, dict):
-                quantity = ing.get(RecipeKeys.QUANTITY, MiscValues.EMPTY).strip()
-                measurement = ing.get(RecipeKeys.MEASUREMENT, MiscValues.EMPTY).strip()
-                ingredient = ing.get(RecipeKeys.INGREDIENT, MiscValues.EMPTY).strip()
-                detail = ing.get(RecipeKeys.DETAIL, MiscValues.EMPTY).strip()
-
-                line_parts = [
-                    part for part in [quantity, measurement, ingredient] if part
-                ]
-                line = MiscValues.SPACE.join(line_parts)
-                if detail and detail.lower() not in line.lower():
+                quantity = ing.get(quantity_key, empty).strip()
+                measurement = ing.get(measurement_key, empty).strip()
+                ingredient = ing.get(ingredient_key, empty).strip()
+                detail = ing.get(detail_key, empty).strip()
+
+                # Most ingredients have all three fields; skip the filter-and-join.
+                if quantity and measurement and ingredient:
+                    line = f"{quantity} {measurement} {ingredient}"
+                else:
+                    line = space.join(
+                        [part for part in (quantity, measurement, ingredient) if part]
+                    )
+                # The exact-case check usually settles it without lowering both.
+                if detail and not (detail in line or detail.lower() in line.lower()):
                     line += f" ({detail})"
 
-                markdown_str += f"- {line}\n"
+                parts.append(f"- {line}\n")
             else:
                 log_with_payload(
                     logging.WARNING, LogMsg.RECIPE_INVALID_INGREDIENT, item=str(ing)
                 )
-                markdown_str += (
+                parts.append(
                     f"- **Warning:** {UiText.INVALID_INGREDIENT_FORMAT} ({str(ing)})\n"
                 )
 
-        markdown_str += "\n"
+        parts.append("\n")
 
     elif ingredients:
         log_with_payload(
-            logging.WARNING, LogMsg.RECIPE_INGREDIENTS_NOT_LIST, type=type(ingredients)
+            logging.WARNING,
+            LogMsg.RECIPE_INGREDIENTS_NOT_LIST,
+            type=type(ingredients).__name__,
         )
 
     instructions = data.get(RecipeKeys.INSTRUCTIONS)
     if instructions and isinstance(instructions, list):
-        markdown_str += f"### Instructions\n\n"
-
-        def get_step_num(instr: Any) -> float:
-            if isinstance(instr, dict):
-                step = instr.get(RecipeKeys.STEP)
-                try:
-                    return float(step) if step is not None else float("inf")
-                except (ValueError, TypeError):
-                    return float("inf")
-            return float("inf")
+        parts.append("### Instructions\n\n")
 
         try:
-            sorted_instructions = sorted(instructions, key=get_step_num)
+            sorted_instructions = sorted(instructions, key=_instruction_step_key)
         except Exception as sort_err:
             err_payload = ErrorPayload(error_message=str(sort_err))
             log_with_payload(
@@ -335,47 +350,42 @@ def display_recipe_markdown(recipe_data: dict[str, Any]) -> str:
                 exc_info=True,
             )
             sorted_instructions = instructions
-            markdown_str += f"- **Warning:** {UiText.WARNING_INSTRUCTION_SORT_FAIL}\n"
+            parts.append(f"- **Warning:** {UiText.WARNING_INSTRUCTION_SORT_FAIL}\n")
 
+        step_key, instruction_key = RecipeKeys.STEP, RecipeKeys.INSTRUCTION
+        default_step = MiscValues.DEFAULT_STEP
         for ins in sorted_instructions:
             if isinstance(ins, dict):
-                step = ins.get(RecipeKeys.STEP, MiscValues.DEFAULT_STEP)
-                instruction_text = ins.get(
-                    RecipeKeys.INSTRUCTION, "No instruction text."
-                )
+                step = ins.get(step_key, default_step)
+                instruction_text = ins.get(instruction_key, "No instruction text.")
 
-                markdown_str += f"{step}. {instruction_text}\n"
+                parts.append(f"{step}. {instruction_text}\n")
 
             else:
                 log_with_payload(
                     logging.WARNING, LogMsg.RECIPE_INVALID_INSTRUCTION, item=str(ins)
                 )
-                markdown_str += (
+                parts.append(
                     f"- **Warning:** {UiText.INVALID_INSTRUCTION_FORMAT} ({str(ins)})\n"
                 )
 
-        markdown_str += "\n"
+        parts.append("\n")
 
     elif instructions:
         log_with_payload(
             logging.WARNING,
             LogMsg.RECIPE_INSTRUCTIONS_NOT_LIST,
-            type=type(instructions),
+            type=type(instructions).__name__,
         )
 
     url = data.get(RecipeKeys.URL) or recipe_data.get(RecipeKeys.URL, MiscValues.EMPTY)
     if url and isinstance(url, str):
-        markdown_str += f"### Source\n\n"
-        url_lower = url.lower()
-
-        if url_lower.startswith(MiscValues.HTTP_PREFIX) or url_lower.startswith(
-            MiscValues.HTTPS_PREFIX
-        ):
-            markdown_str += f"[{url}]({url})\n\n"
-        else:
-            markdown_str += f"{url}\n\n"
+        link = f"[{url}]({url})" if url.lower().startswith(_URL_SCHEMES) else url
+        parts.append(f"### Source\n\n{link}\n\n")
     elif url:
-        log_with_payload(logging.WARNING, LogMsg.RECIPE_URL_NOT_STRING, type=type(url))
+        log_with_payload(
+            logging.WARNING, LogMsg.RECIPE_URL_NOT_STRING, type=type(url).__name__
+        )
 
-    return markdown_str
+    return MiscValues.EMPTY.join(parts)
 
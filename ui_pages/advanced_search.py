@@ -1,7 +1,9 @@
 import base64
+import hashlib
 import json
 import logging
-from datetime import datetime
+from collections import defaultdict
+from typing import Any, Callable
 
 import pandas as pd
 import streamlit as st
@@ -15,6 +17,8 @@ from constants import (
     FormatStrings,
     TagFilterMode,
     ProfileDataKeys,
+    ProfileWireKeys,
+    ProfileWireVersion,
     LogMsg,
 )
 from db_utils import save_profile, load_profile, fetch_sources_cached
@@ -24,6 +28,205 @@ from query_top_k import query_top_k
 from session_state import SessionStateKeys
 from ui_helpers import UiText, display_recipe_markdown
 
+_TAG_MODE_BY_VALUE: dict[str, TagFilterMode] = {m.value: m for m in TagFilterMode}
+
+# (category, multiselect widget) pairs read into tag_filters / excluded_tags.
+_INCLUDE_TAG_KEYS: tuple[tuple[CategoryKeys, SessionStateKeys], ...] = (
+    (CategoryKeys.COURSE, SessionStateKeys.ADV_COURSE_FILTER_INPUT),
+    (CategoryKeys.MAIN_INGREDIENT, SessionStateKeys.ADV_MAIN_ING_FILTER_INPUT),
+    (CategoryKeys.DISH_TYPE, SessionStateKeys.ADV_DISH_TYPE_FILTER_INPUT),
+    (CategoryKeys.RECIPE_TYPE, SessionStateKeys.ADV_RECIPE_TYPE_FILTER_INPUT),
+    (CategoryKeys.CUISINE, SessionStateKeys.ADV_CUISINE_FILTER_INPUT),
+)
+_EXCLUDE_TAG_KEYS: tuple[tuple[CategoryKeys, SessionStateKeys], ...] = (
+    (CategoryKeys.COURSE, SessionStateKeys.ADV_EXCLUDE_COURSE_FILTER_INPUT),
+    (CategoryKeys.MAIN_INGREDIENT, SessionStateKeys.ADV_EXCLUDE_MAIN_ING_FILTER_INPUT),
+    (CategoryKeys.DISH_TYPE, SessionStateKeys.ADV_EXCLUDE_DISH_TYPE_FILTER_INPUT),
+    (CategoryKeys.RECIPE_TYPE, SessionStateKeys.ADV_EXCLUDE_RECIPE_TYPE_FILTER_INPUT),
+    (CategoryKeys.CUISINE, SessionStateKeys.ADV_EXCLUDE_CUISINE_FILTER_INPUT),
+)
+
+
+def _no_selection(_: AppConfig) -> list[str]:
+    """Default for the multiselect fields: nothing selected."""
+    return []
+
+
+_PROFILE_SAVE_FIELDS: tuple[
+    tuple[ProfileDataKeys, SessionStateKeys, Callable[[AppConfig], Any]], ...
+] = (
+    (
+        ProfileDataKeys.INGREDIENTS_TEXT,
+        SessionStateKeys.ADV_INGREDIENTS_INPUT,
+        lambda c: c.defaults.ingredients_text,
+    ),
+    (
+        ProfileDataKeys.MUST_USE_TEXT,
+        SessionStateKeys.ADV_MUST_USE_INPUT,
+        lambda c: c.defaults.must_use_text,
+    ),
+    (
+        ProfileDataKeys.EXCLUDED_BOX,
+        SessionStateKeys.ADV_EXCLUDED_INPUT,
+        lambda c: c.defaults.excluded_text,
+    ),
+    (
+        ProfileDataKeys.KEYWORDS_INCLUDE,
+        SessionStateKeys.ADV_KEYWORDS_INCLUDE_INPUT,
+        lambda c: c.defaults.keywords_include,
+    ),
+    (
+        ProfileDataKeys.KEYWORDS_EXCLUDE,
+        SessionStateKeys.ADV_KEYWORDS_EXCLUDE_INPUT,
+        lambda c: c.defaults.keywords_exclude,
+    ),
+    (
+        ProfileDataKeys.MIN_ING_MATCHES,
+        SessionStateKeys.ADV_MIN_ING_MATCHES_INPUT,
+        lambda c: c.defaults.min_ing_matches,
+    ),
+    (
+        ProfileDataKeys.COURSE_FILTER,
+        SessionStateKeys.ADV_COURSE_FILTER_INPUT,
+        _no_selection,
+    ),
+    (
+        ProfileDataKeys.MAIN_ING_FILTER,
+        SessionStateKeys.ADV_MAIN_ING_FILTER_INPUT,
+        _no_selection,
+    ),
+    (
+        ProfileDataKeys.DISH_TYPE_FILTER,
+        SessionStateKeys.ADV_DISH_TYPE_FILTER_INPUT,
+        _no_selection,
+    ),
+    (
+        ProfileDataKeys.RECIPE_TYPE_FILTER,
+        SessionStateKeys.ADV_RECIPE_TYPE_FILTER_INPUT,
+        _no_selection,
+    ),
+    (
+        ProfileDataKeys.CUISINE_FILTER,
+        SessionStateKeys.ADV_CUISINE_FILTER_INPUT,
+        _no_selection,
+    ),
+    (
+        ProfileDataKeys.EXCLUDE_COURSE_FILTER,
+        SessionStateKeys.ADV_EXCLUDE_COURSE_FILTER_INPUT,
+        _no_selection,
+    ),
+    (
+        ProfileDataKeys.EXCLUDE_MAIN_ING_FILTER,
+        SessionStateKeys.ADV_EXCLUDE_MAIN_ING_FILTER_INPUT,
+        _no_selection,
+    ),
+    (
+        ProfileDataKeys.EXCLUDE_DISH_TYPE_FILTER,
+        SessionStateKeys.ADV_EXCLUDE_DISH_TYPE_FILTER_INPUT,
+        _no_selection,
+    ),
+    (
+        ProfileDataKeys.EXCLUDE_RECIPE_TYPE_FILTER,
+        SessionStateKeys.ADV_EXCLUDE_RECIPE_TYPE_FILTER_INPUT,
+        _no_selection,
+    ),
+    (
+        ProfileDataKeys.EXCLUDE_CUISINE_FILTER,
+        SessionStateKeys.ADV_EXCLUDE_CUISINE_FILTER_INPUT,
+        _no_selection,
+    ),
+    (
+        ProfileDataKeys.TAG_FILTER_MODE,
+        SessionStateKeys.ADV_TAG_FILTER_MODE_INPUT,
+        lambda c: c._validated_default_tag_filter_mode,
+    ),
+    (
+        ProfileDataKeys.MAX_STEPS,
+        SessionStateKeys.ADV_MAX_STEPS_INPUT,
+        lambda c: c.defaults.max_steps,
+    ),
+    (
+        ProfileDataKeys.USER_COVERAGE_SLIDER,
+        SessionStateKeys.ADV_USER_COVERAGE_SLIDER,
+        lambda c: c.defaults.user_coverage_pct,
+    ),
+    (
+        ProfileDataKeys.RECIPE_COVERAGE_SLIDER,
+        SessionStateKeys.ADV_RECIPE_COVERAGE_SLIDER,
+        lambda c: c.defaults.recipe_coverage_pct,
+    ),
+    (
+        ProfileDataKeys.SOURCES,
+        SessionStateKeys.ADV_SOURCE_SELECTOR,
+        _no_selection,
+    ),
+)
+
+_PROFILE_NUMERIC_CASTS: tuple[tuple[ProfileDataKeys, Callable[[Any], Any]], ...] = (
+    (ProfileDataKeys.MIN_ING_MATCHES, int),
+    (ProfileDataKeys.MAX_STEPS, int),
+    (ProfileDataKeys.USER_COVERAGE_SLIDER, float),
+    (ProfileDataKeys.RECIPE_COVERAGE_SLIDER, float),
+)
+
+_PROFILE_WIRE_KEYS: dict[ProfileDataKeys, ProfileWireKeys] = {
+    ProfileDataKeys[wire_key.name]: wire_key
+    for wire_key in ProfileWireKeys
+    if wire_key is not ProfileWireKeys.VERSION
+}
+_PROFILE_KEYS_BY_WIRE: dict[str, ProfileDataKeys] = {
+    wire_key.value: profile_key
+    for profile_key, wire_key in _PROFILE_WIRE_KEYS.items()
+}
+
+
+def _options_to_wire(options: dict[ProfileDataKeys, Any]) -> dict[str, Any]:
+    """Rename profile options to their short wire keys and tag the version."""
+    wire = {_PROFILE_WIRE_KEYS[key]: value for key, value in options.items()}
+    wire[ProfileWireKeys.VERSION] = ProfileWireVersion.COMPACT
+    return wire
+
+
+def _options_from_wire(stored: dict[str, Any]) -> dict[str, Any]:
+    """Map stored options back to ProfileDataKeys; untagged profiles pass through."""
+    if stored.get(ProfileWireKeys.VERSION) != ProfileWireVersion.COMPACT:
+        return stored
+    return {
+        _PROFILE_KEYS_BY_WIRE[key]: value
+        for key, value in stored.items()
+        if key in _PROFILE_KEYS_BY_WIRE
+    }
+
+
+def _encode_profile(
+    username: str, options: dict[ProfileDataKeys, Any], indent: int
+) -> tuple[bytes, str]:
+    """
+    Serialize profile options to wire-format JSON bytes.
+    Also returns the digest compared against LAST_SAVED_PROFILE_HASH.
+    """
+    json_bytes = json.dumps(_options_to_wire(options), indent=indent).encode(
+        FormatStrings.ENCODING_UTF8
+    )
+    options_hash = hashlib.blake2b(
+        username.encode(FormatStrings.ENCODING_UTF8) + b"\0" + json_bytes,
+        digest_size=16,
+    ).hexdigest()
+    return json_bytes, options_hash
+
+
+def _stored_profile_matches(username: str, options: dict[ProfileDataKeys, Any]) -> bool:
+    """Whether the newest stored profile for ``username`` already holds ``options``."""
+    stored = load_profile(username)
+    if stored is None:
+        return False
+    return _options_from_wire(stored.get(ProfileDataKeys.OPTIONS, {})) == options
+
+
+def _filter_sources(sources: list[str]) -> list[str]:
+    """Drop the error placeholder that init stores when sources fail to load."""
+    return [s for s in sources if s != UiText.ERROR_SOURCES_DISPLAY]
+
 
 def render_advanced_search_page(
     st: st.session_state, config: AppConfig, default_tag_filter_mode_enum: TagFilterMode
@@ -33,9 +236,12 @@ def render_advanced_search_page(
     def run_advanced_search():
         log_with_payload(logging.INFO, LogMsg.ADV_SEARCH_CLICKED)
         defaults = config.defaults
+        # One plain-dict snapshot for the reads below; each proxy .get() is far
+        # slower than a dict lookup. Writes still go through st.session_state.
+        snap = st.session_state.to_dict()
 
         def get_list_from_textarea(key: SessionStateKeys) -> list[str]:
-            text = st.session_state.get(key, MiscValues.EMPTY)
+            text = snap.get(key, MiscValues.EMPTY)
             return [
                 item.strip()
                 for item in text.strip().split(MiscValues.NEWLINE)
@@ -43,7 +249,7 @@ def render_advanced_search_page(
             ]
 
         def get_list_from_textinput(key: SessionStateKeys) -> list[str]:
-            text = st.session_state.get(key, MiscValues.EMPTY)
+            text = snap.get(key, MiscValues.EMPTY)
             return [
                 item.strip()
                 for item in text.strip().split(MiscValues.SPACE)
@@ -51,58 +257,24 @@ def render_advanced_search_page(
             ]
 
         tag_filters = {
-            cat_key: st.session_state.get(widget_key, [])
-            for cat_key, widget_key in [
-                (CategoryKeys.COURSE, SessionStateKeys.ADV_COURSE_FILTER_INPUT),
-                (
-                    CategoryKeys.MAIN_INGREDIENT,
-                    SessionStateKeys.ADV_MAIN_ING_FILTER_INPUT,
-                ),
-                (CategoryKeys.DISH_TYPE, SessionStateKeys.ADV_DISH_TYPE_FILTER_INPUT),
-                (
-                    CategoryKeys.RECIPE_TYPE,
-                    SessionStateKeys.ADV_RECIPE_TYPE_FILTER_INPUT,
-                ),
-                (CategoryKeys.CUISINE, SessionStateKeys.ADV_CUISINE_FILTER_INPUT),
-            ]
-            if st.session_state.get(widget_key)
+            cat_key: snap.get(widget_key, [])
+            for cat_key, widget_key in _INCLUDE_TAG_KEYS
+            if snap.get(widget_key)
         }
         excluded_tags = {
-            cat_key: st.session_state.get(widget_key, [])
-            for cat_key, widget_key in [
-                (CategoryKeys.COURSE, SessionStateKeys.ADV_EXCLUDE_COURSE_FILTER_INPUT),
-                (
-                    CategoryKeys.MAIN_INGREDIENT,
-                    SessionStateKeys.ADV_EXCLUDE_MAIN_ING_FILTER_INPUT,
-                ),
-                (
-                    CategoryKeys.DISH_TYPE,
-                    SessionStateKeys.ADV_EXCLUDE_DISH_TYPE_FILTER_INPUT,
-                ),
-                (
-                    CategoryKeys.RECIPE_TYPE,
-                    SessionStateKeys.ADV_EXCLUDE_RECIPE_TYPE_FILTER_INPUT,
-                ),
-                (
-                    CategoryKeys.CUISINE,
-                    SessionStateKeys.ADV_EXCLUDE_CUISINE_FILTER_INPUT,
-                ),
-            ]
-            if st.session_state.get(widget_key)
+            cat_key: snap.get(widget_key, [])
+            for cat_key, widget_key in _EXCLUDE_TAG_KEYS
+            if snap.get(widget_key)
         }
 
-        selected_sources = [
-            s
-            for s in st.session_state.get(SessionStateKeys.ADV_SOURCE_SELECTOR, [])
-            if s != UiText.ERROR_SOURCES_DISPLAY
-        ]
+        selected_sources = _filter_sources(
+            snap.get(SessionStateKeys.ADV_SOURCE_SELECTOR, [])
+        )
 
         if not selected_sources:
-            selected_sources = [
-                s
-                for s in st.session_state.get(SessionStateKeys.ALL_SOURCES_LIST, [])
-                if s != UiText.ERROR_SOURCES_DISPLAY
-            ]
+            selected_sources = _filter_sources(
+                snap.get(SessionStateKeys.ALL_SOURCES_LIST, [])
+            )
 
         query_params = dict(
             user_ingredients=get_list_from_textarea(
@@ -111,7 +283,7 @@ def render_advanced_search_page(
             tag_filters=tag_filters,
             excluded_tags=excluded_tags,
             min_ing_matches=int(
-                st.session_state.get(
+                snap.get(
                     SessionStateKeys.ADV_MIN_ING_MATCHES_INPUT, defaults.min_ing_matches
                 )
             ),
@@ -119,25 +291,23 @@ def render_advanced_search_page(
                 SessionStateKeys.ADV_EXCLUDED_INPUT
             ),
             must_use=get_list_from_textarea(SessionStateKeys.ADV_MUST_USE_INPUT),
-            tag_filter_mode=st.session_state.get(
+            tag_filter_mode=snap.get(
                 SessionStateKeys.ADV_TAG_FILTER_MODE_INPUT, default_tag_filter_mode_enum
             ),
             max_steps=int(
-                st.session_state.get(
-                    SessionStateKeys.ADV_MAX_STEPS_INPUT, defaults.max_steps
-                )
+                snap.get(SessionStateKeys.ADV_MAX_STEPS_INPUT, defaults.max_steps)
             ),
             user_coverage_req=float(
-                st.session_state.get(
+                snap.get(
                     SessionStateKeys.ADV_USER_COVERAGE_SLIDER,
-                    defaults.user_coverage * 100.0,
+                    defaults.user_coverage_pct,
                 )
             )
             / 100.0,
             recipe_coverage_req=float(
-                st.session_state.get(
+                snap.get(
                     SessionStateKeys.ADV_RECIPE_COVERAGE_SLIDER,
-                    defaults.recipe_coverage * 100.0,
+                    defaults.recipe_coverage_pct,
                 )
             )
             / 100.0,
@@ -183,6 +353,7 @@ def render_advanced_search_page(
             )
 
             st.session_state[SessionStateKeys.ADVANCED_SEARCH_MAPPING] = {}
+            st.session_state[SessionStateKeys.ADVANCED_SEARCH_LABEL_INDEX] = {}
             st.session_state[SessionStateKeys.ADVANCED_SEARCH_RESULTS_DF] = None
             st.session_state[SessionStateKeys.ADVANCED_SELECTED_RECIPE_LABEL] = None
             return
@@ -195,6 +366,7 @@ def render_advanced_search_page(
                 UiText.MSG_NO_RESULTS_FOUND_ADV
             )
             st.session_state[SessionStateKeys.ADVANCED_SEARCH_MAPPING] = {}
+            st.session_state[SessionStateKeys.ADVANCED_SEARCH_LABEL_INDEX] = {}
             st.session_state[SessionStateKeys.ADVANCED_SEARCH_RESULTS_DF] = None
             st.session_state[SessionStateKeys.ADVANCED_SELECTED_RECIPE_LABEL] = None
         else:
@@ -206,45 +378,59 @@ def render_advanced_search_page(
                 count=len(results),
             )
 
-            results_data_for_df = []
+            user_covs: list[str] = []
+            recipe_covs: list[str] = []
+            urls: list[str] = []
+            titles: list[str] = []
             dropdown_mapping = {}
+            label_counts: defaultdict[str, int] = defaultdict(int)
+            format_label = FormatStrings.RECIPE_LABEL.format
+            format_duplicate = FormatStrings.RECIPE_LABEL_DUPLICATE.format
+            default_url = UiText.DEFAULT_RECIPE_URL
+            default_title = UiText.DEFAULT_RECIPE_TITLE
             for r in results:
                 user_cov = r.get(RecipeKeys.USER_COVERAGE, 0.0)
                 recipe_cov = r.get(RecipeKeys.RECIPE_COVERAGE, 0.0)
-                url = r.get(RecipeKeys.URL, UiText.DEFAULT_RECIPE_URL)
-                title = r.get(RecipeKeys.TITLE, UiText.DEFAULT_RECIPE_TITLE)
+                url = r.get(RecipeKeys.URL, default_url)
+                title = r.get(RecipeKeys.TITLE, default_title)
                 recipe_dict = r.get(RecipeKeys.RECIPE, {})
 
-                df_row = {
-                    "User Coverage": f"{user_cov:.1%}",
-                    "Recipe Coverage": f"{recipe_cov:.1%}",
-                    "Source / URL": url,
-                    "Recipe Title": title,
-                }
-                results_data_for_df.append(df_row)
+                user_covs.append(f"{user_cov:.1%}")
+                recipe_covs.append(f"{recipe_cov:.1%}")
+                urls.append(url)
+                titles.append(title)
 
-                label = FormatStrings.RECIPE_LABEL.format(
-                    coverage=recipe_cov, title=title
-                )
-                original_label = label
-                count = 1
+                original_label = format_label(coverage=recipe_cov, title=title)
+                # Resume from the last suffix used for this label, as simple
+                # search does, rather than probing "(1)", "(2)", ... each time.
+                count = label_counts[original_label]
+                label = original_label
                 while label in dropdown_mapping:
-                    label = FormatStrings.RECIPE_LABEL_DUPLICATE.format(
-                        original_label=original_label, count=count
-                    )
                     count += 1
+                    label = format_duplicate(original_label=original_label, count=count)
+                label_counts[original_label] = count
 
                 dropdown_mapping[label] = {
                     RecipeKeys.URL: url,
                     RecipeKeys.RECIPE: recipe_dict,
                 }
 
-            results_df = pd.DataFrame(results_data_for_df)
+            results_df = pd.DataFrame(
+                {
+                    "User Coverage": user_covs,
+                    "Recipe Coverage": recipe_covs,
+                    "Source / URL": urls,
+                    "Recipe Title": titles,
+                }
+            )
 
             st.session_state[SessionStateKeys.ADVANCED_SEARCH_RESULTS_DF] = results_df
             st.session_state[SessionStateKeys.ADVANCED_SEARCH_MAPPING] = (
                 dropdown_mapping
             )
+            st.session_state[SessionStateKeys.ADVANCED_SEARCH_LABEL_INDEX] = {
+                label: i for i, label in enumerate(dropdown_mapping)
+            }
 
             st.session_state[SessionStateKeys.ADVANCED_SEARCH_RESULTS_HTML] = (
                 MiscValues.EMPTY
@@ -266,9 +452,8 @@ def render_advanced_search_page(
     def save_profile_action():
         log_with_payload(logging.INFO, LogMsg.PROFILE_SAVE_CLICKED)
         defaults = config.defaults
-        username = st.session_state.get(
-            SessionStateKeys.USERNAME_INPUT, defaults.username
-        )
+        snap = st.session_state.to_dict()
+        username = snap.get(SessionStateKeys.USERNAME_INPUT, defaults.username)
 
         if not username or not username.strip():
             st.session_state[SessionStateKeys.PROFILE_STATUS_MESSAGE] = (
@@ -280,86 +465,16 @@ def render_advanced_search_page(
         payload = ProfilePayload(username=username)
 
         options_dict = {
-            ProfileDataKeys.INGREDIENTS_TEXT: st.session_state.get(
-                SessionStateKeys.ADV_INGREDIENTS_INPUT, defaults.ingredients_text
-            ),
-            ProfileDataKeys.MUST_USE_TEXT: st.session_state.get(
-                SessionStateKeys.ADV_MUST_USE_INPUT, defaults.must_use_text
-            ),
-            ProfileDataKeys.EXCLUDED_BOX: st.session_state.get(
-                SessionStateKeys.ADV_EXCLUDED_INPUT, defaults.excluded_text
-            ),
-            ProfileDataKeys.KEYWORDS_INCLUDE: st.session_state.get(
-                SessionStateKeys.ADV_KEYWORDS_INCLUDE_INPUT, defaults.keywords_include
-            ),
-            ProfileDataKeys.KEYWORDS_EXCLUDE: st.session_state.get(
-                SessionStateKeys.ADV_KEYWORDS_EXCLUDE_INPUT, defaults.keywords_exclude
-            ),
-            ProfileDataKeys.MIN_ING_MATCHES: int(
-                st.session_state.get(
-                    SessionStateKeys.ADV_MIN_ING_MATCHES_INPUT, defaults.min_ing_matches
-                )
-            ),
-            ProfileDataKeys.COURSE_FILTER: st.session_state.get(
-                SessionStateKeys.ADV_COURSE_FILTER_INPUT, []
-            ),
-            ProfileDataKeys.MAIN_ING_FILTER: st.session_state.get(
-                SessionStateKeys.ADV_MAIN_ING_FILTER_INPUT, []
-            ),
-            ProfileDataKeys.DISH_TYPE_FILTER: st.session_state.get(
-                SessionStateKeys.ADV_DISH_TYPE_FILTER_INPUT, []
-            ),
-            ProfileDataKeys.RECIPE_TYPE_FILTER: st.session_state.get(
-                SessionStateKeys.ADV_RECIPE_TYPE_FILTER_INPUT, []
-            ),
-            ProfileDataKeys.CUISINE_FILTER: st.session_state.get(
-                SessionStateKeys.ADV_CUISINE_FILTER_INPUT, []
-            ),
-            ProfileDataKeys.EXCLUDE_COURSE_FILTER: st.session_state.get(
-                SessionStateKeys.ADV_EXCLUDE_COURSE_FILTER_INPUT, []
-            ),
-            ProfileDataKeys.EXCLUDE_MAIN_ING_FILTER: st.session_state.get(
-                SessionStateKeys.ADV_EXCLUDE_MAIN_ING_FILTER_INPUT, []
-            ),
-            ProfileDataKeys.EXCLUDE_DISH_TYPE_FILTER: st.session_state.get(
-                SessionStateKeys.ADV_EXCLUDE_DISH_TYPE_FILTER_INPUT, []
-            ),
-            ProfileDataKeys.EXCLUDE_RECIPE_TYPE_FILTER: st.session_state.get(
-                SessionStateKeys.ADV_EXCLUDE_RECIPE_TYPE_FILTER_INPUT, []
-            ),
-            ProfileDataKeys.EXCLUDE_CUISINE_FILTER: st.session_state.get(
-                SessionStateKeys.ADV_EXCLUDE_CUISINE_FILTER_INPUT, []
-            ),
-            ProfileDataKeys.TAG_FILTER_MODE: st.session_state.get(
-                SessionStateKeys.ADV_TAG_FILTER_MODE_INPUT, default_tag_filter_mode_enum
-            ),
-            ProfileDataKeys.MAX_STEPS: int(
-                st.session_state.get(
-                    SessionStateKeys.ADV_MAX_STEPS_INPUT, defaults.max_steps
-                )
-            ),
-            ProfileDataKeys.USER_COVERAGE_SLIDER: float(
-                st.session_state.get(
-                    SessionStateKeys.ADV_USER_COVERAGE_SLIDER,
-                    defaults.user_coverage * 100.0,
-                )
-            ),
-            ProfileDataKeys.RECIPE_COVERAGE_SLIDER: float(
-                st.session_state.get(
-                    SessionStateKeys.ADV_RECIPE_COVERAGE_SLIDER,
-                    defaults.recipe_coverage * 100.0,
-                )
-            ),
-            ProfileDataKeys.SOURCES: st.session_state.get(
-                SessionStateKeys.ADV_SOURCE_SELECTOR, []
-            ),
+            profile_key: snap.get(widget_key, get_default(config))
+            for profile_key, widget_key, get_default in _PROFILE_SAVE_FIELDS
         }
+        for profile_key, cast in _PROFILE_NUMERIC_CASTS:
+            options_dict[profile_key] = cast(options_dict[profile_key])
 
         try:
-            json_str = json.dumps(options_dict, indent=config.json_indent)
-            b64_str = base64.b64encode(
-                json_str.encode(FormatStrings.ENCODING_UTF8)
-            ).decode(FormatStrings.ENCODING_UTF8)
+            json_bytes, options_hash = _encode_profile(
+                username, options_dict, config.json_indent
+            )
         except (TypeError, json.JSONDecodeError) as e:
             err_payload = ErrorPayload(error_message=str(e))
             log_with_payload(
@@ -370,14 +485,32 @@ def render_advanced_search_page(
                 error=str(e),
                 exc_info=True,
             )
+            st.session_state.pop(SessionStateKeys.LAST_SAVED_PROFILE_HASH, None)
             st.session_state[SessionStateKeys.PROFILE_STATUS_MESSAGE] = (
                 UiText.PROFILE_MSG_ENCODE_ERROR.format(error=e)
             )
             return
 
+        # The hash only covers this session; another device may have saved
+        # since, so the stored row is checked before the save is skipped.
+        last_saved_hash = snap.get(SessionStateKeys.LAST_SAVED_PROFILE_HASH)
+        if last_saved_hash == options_hash and _stored_profile_matches(
+            username, options_dict
+        ):
+            log_with_payload(
+                logging.INFO, LogMsg.PROFILE_SAVE_UNCHANGED, payload=payload
+            )
+            st.session_state[SessionStateKeys.PROFILE_STATUS_MESSAGE] = (
+                UiText.PROFILE_MSG_SAVE_UNCHANGED.format(username=username)
+            )
+            return
+
+        b64_str = base64.b64encode(json_bytes).decode(FormatStrings.ENCODING_UTF8)
+
         try:
             saved_ts = save_profile(username, b64_str)
             payload.timestamp = saved_ts
+            st.session_state[SessionStateKeys.LAST_SAVED_PROFILE_HASH] = options_hash
             log_with_payload(
                 logging.INFO, "Profile saved via UI action.", payload=payload
             )
@@ -395,6 +528,7 @@ def render_advanced_search_page(
                 profile_payload=payload,
                 error=str(e),
             )
+            st.session_state.pop(SessionStateKeys.LAST_SAVED_PROFILE_HASH, None)
             st.session_state[SessionStateKeys.PROFILE_STATUS_MESSAGE] = (
                 UiText.PROFILE_MSG_SAVE_ERROR.format(error=e)
             )
@@ -408,6 +542,7 @@ def render_advanced_search_page(
                 error=str(e),
                 exc_info=True,
             )
+            st.session_state.pop(SessionStateKeys.LAST_SAVED_PROFILE_HASH, None)
             st.session_state[SessionStateKeys.PROFILE_STATUS_MESSAGE] = (
                 UiText.PROFILE_MSG_SAVE_ERROR.format(error=e)
             )
@@ -431,11 +566,14 @@ def render_advanced_search_page(
         try:
             loaded_data = load_profile(username)
             if loaded_data is None:
+                st.session_state.pop(SessionStateKeys.LAST_SAVED_PROFILE_HASH, None)
                 st.session_state[SessionStateKeys.PROFILE_STATUS_MESSAGE] = (
                     UiText.PROFILE_MSG_LOAD_NOT_FOUND.format(username=username)
                 )
             else:
-                options = loaded_data.get(ProfileDataKeys.OPTIONS, {})
+                options = _options_from_wire(
+                    loaded_data.get(ProfileDataKeys.OPTIONS, {})
+                )
                 timestamp = loaded_data.get(
                     ProfileDataKeys.TIMESTAMP, UiText.DEFAULT_TIMESTAMP
                 )
@@ -462,7 +600,7 @@ def render_advanced_search_page(
                         ProfileDataKeys.KEYWORDS_EXCLUDE, defaults.keywords_exclude
                     )
                 )
-                st.session_state[SessionStateKeys.LOADED_MIN_ING_MATCHES] = int(
+                st.session_state[SessionStateKeys.LOADED_MIN_ING_MATCHES] = (
                     options.get(
                         ProfileDataKeys.MIN_ING_MATCHES, defaults.min_ing_matches
                     )
@@ -501,48 +639,61 @@ def render_advanced_search_page(
                 loaded_mode_str = options.get(
                     ProfileDataKeys.TAG_FILTER_MODE, default_tag_filter_mode_enum
                 )
-                try:
-                    st.session_state[SessionStateKeys.LOADED_TAG_FILTER_MODE] = (
-                        TagFilterMode(loaded_mode_str)
-                    )
-                except ValueError:
+                loaded_mode = _TAG_MODE_BY_VALUE.get(loaded_mode_str)
+                if loaded_mode is None:
                     log_with_payload(
                         logging.WARNING,
                         LogMsg.PROFILE_INVALID_MODE_LOADED,
                         payload=payload,
                         mode=loaded_mode_str,
                     )
-                    st.session_state[SessionStateKeys.LOADED_TAG_FILTER_MODE] = (
-                        default_tag_filter_mode_enum
-                    )
+                    loaded_mode = default_tag_filter_mode_enum
+                st.session_state[SessionStateKeys.LOADED_TAG_FILTER_MODE] = loaded_mode
 
-                st.session_state[SessionStateKeys.LOADED_MAX_STEPS] = int(
-                    options.get(ProfileDataKeys.MAX_STEPS, defaults.max_steps)
+                # Numeric fields are cast in save_profile_action, so the JSON
+                # already carries the right int/float types.
+                st.session_state[SessionStateKeys.LOADED_MAX_STEPS] = options.get(
+                    ProfileDataKeys.MAX_STEPS, defaults.max_steps
                 )
 
-                st.session_state[SessionStateKeys.LOADED_USER_COVERAGE] = float(
-                    options.get(
-                        ProfileDataKeys.USER_COVERAGE_SLIDER,
-                        defaults.user_coverage * 100.0,
-                    )
+                st.session_state[SessionStateKeys.LOADED_USER_COVERAGE] = options.get(
+                    ProfileDataKeys.USER_COVERAGE_SLIDER,
+                    defaults.user_coverage_pct,
                 )
-                st.session_state[SessionStateKeys.LOADED_RECIPE_COVERAGE] = float(
+                st.session_state[SessionStateKeys.LOADED_RECIPE_COVERAGE] = (
                     options.get(
                         ProfileDataKeys.RECIPE_COVERAGE_SLIDER,
-                        defaults.recipe_coverage * 100.0,
+                        defaults.recipe_coverage_pct,
                     )
                 )
 
-                valid_current_sources = [
-                    s
-                    for s in st.session_state.get(SessionStateKeys.ALL_SOURCES_LIST, [])
-                    if s != UiText.ERROR_SOURCES_DISPLAY
-                ]
+                valid_current_sources = frozenset(
+                    _filter_sources(
+                        st.session_state.get(SessionStateKeys.ALL_SOURCES_LIST, [])
+                    )
+                )
                 loaded_profile_sources = options.get(ProfileDataKeys.SOURCES, [])
                 st.session_state[SessionStateKeys.LOADED_SOURCES] = [
                     s for s in loaded_profile_sources if s in valid_current_sources
                 ]
 
+                # The stored profile now matches what is on screen, so hash it the
+                # way save_profile_action would; saving different options must
+                # not be mistaken for "no changes" against an older save.
+                loaded_options = {
+                    profile_key: options.get(profile_key, get_default(config))
+                    for profile_key, _, get_default in _PROFILE_SAVE_FIELDS
+                }
+                loaded_options[ProfileDataKeys.TAG_FILTER_MODE] = loaded_mode
+                loaded_options[ProfileDataKeys.SOURCES] = st.session_state[
+                    SessionStateKeys.LOADED_SOURCES
+                ]
+                for profile_key, cast in _PROFILE_NUMERIC_CASTS:
+                    loaded_options[profile_key] = cast(loaded_options[profile_key])
+                _, st.session_state[SessionStateKeys.LAST_SAVED_PROFILE_HASH] = (
+                    _encode_profile(username, loaded_options, config.json_indent)
+                )
+
                 st.session_state[SessionStateKeys.PROFILE_STATUS_MESSAGE] = (
                     UiText.PROFILE_MSG_LOAD_SUCCESS.format(
                         username=username, timestamp=timestamp
@@ -565,6 +716,7 @@ def render_advanced_search_page(
                 error=str(e),
                 exc_info=True,
             )
+            st.session_state.pop(SessionStateKeys.LAST_SAVED_PROFILE_HASH, None)
             st.session_state[SessionStateKeys.PROFILE_STATUS_MESSAGE] = (
                 UiText.PROFILE_MSG_LOAD_ERROR.format(error=e)
             )
@@ -574,29 +726,18 @@ def render_advanced_search_page(
 
         fetch_sources_cached.clear()
         try:
-            db_update_time = fetch_db_last_updated()
-            if db_update_time:
-                cache_key_time = (
-                    db_update_time.strftime(FormatStrings.TIMESTAMP_CACHE_KEY)
-                    if isinstance(db_update_time, datetime)
-                    else str(db_update_time)
+            new_sources = fetch_sources_cached(fetch_db_last_updated())
+            valid_new_sources = _filter_sources(new_sources)
+            source_updates = {
+                SessionStateKeys.ALL_SOURCES_LIST: valid_new_sources,
+                SessionStateKeys.LOADED_SOURCES: valid_new_sources,
+            }
+            if SessionStateKeys.ADV_SOURCE_SELECTOR in st.session_state:
+                source_updates[SessionStateKeys.ADV_SOURCE_SELECTOR] = (
+                    valid_new_sources
                 )
-                new_sources = fetch_sources_cached(cache_key_time)
-                valid_new_sources = [
-                    s for s in new_sources if s != UiText.ERROR_SOURCES_DISPLAY
-                ]
-                st.session_state[SessionStateKeys.ALL_SOURCES_LIST] = valid_new_sources
-
-                st.session_state[SessionStateKeys.LOADED_SOURCES] = valid_new_sources
-
-                if SessionStateKeys.ADV_SOURCE_SELECTOR in st.session_state:
-                    st.session_state[SessionStateKeys.ADV_SOURCE_SELECTOR] = (
-                        valid_new_sources
-                    )
-                log_with_payload(logging.INFO, LogMsg.SOURCES_REFRESHED)
-            else:
-                log_with_payload(logging.WARNING, LogMsg.SOURCES_REFRESH_DB_TIME_FAIL)
-                st.error(LogMsg.SOURCES_REFRESH_DB_TIME_FAIL)
+            st.session_state.update(source_updates)
+            log_with_payload(logging.INFO, LogMsg.SOURCES_REFRESHED)
         except Exception as e:
             err_payload = ErrorPayload(error_message=str(e))
             log_with_payload(
@@ -612,14 +753,12 @@ def render_advanced_search_page(
         log_with_payload(logging.INFO, LogMsg.SOURCES_SELECT_ALL_CLICKED)
         all_sources_list = st.session_state.get(SessionStateKeys.ALL_SOURCES_LIST, [])
 
-        valid_sources = [
-            s for s in all_sources_list if s != UiText.ERROR_SOURCES_DISPLAY
-        ]
-
-        st.session_state[SessionStateKeys.LOADED_SOURCES] = valid_sources
+        valid_sources = _filter_sources(all_sources_list)
 
+        source_updates = {SessionStateKeys.LOADED_SOURCES: valid_sources}
         if SessionStateKeys.ADV_SOURCE_SELECTOR in st.session_state:
-            st.session_state[SessionStateKeys.ADV_SOURCE_SELECTOR] = valid_sources
+            source_updates[SessionStateKeys.ADV_SOURCE_SELECTOR] = valid_sources
+        st.session_state.update(source_updates)
         log_with_payload(
             logging.INFO, LogMsg.SOURCES_SET_ALL, source_count=len(valid_sources)
         )
@@ -645,9 +784,9 @@ def render_advanced_search_page(
         st.session_state.pop(SessionStateKeys.ADV_MAX_STEPS_INPUT, None)
         st.session_state[SessionStateKeys.LOADED_TAG_FILTER_MODE] = default_tag_filter_mode_enum
         st.session_state.pop(SessionStateKeys.ADV_TAG_FILTER_MODE_INPUT, None)
-        st.session_state[SessionStateKeys.LOADED_USER_COVERAGE] = defaults.user_coverage * 100.0
+        st.session_state[SessionStateKeys.LOADED_USER_COVERAGE] = defaults.user_coverage_pct
         st.session_state.pop(SessionStateKeys.ADV_USER_COVERAGE_SLIDER, None)
-        st.session_state[SessionStateKeys.LOADED_RECIPE_COVERAGE] = defaults.recipe_coverage * 100.0
+        st.session_state[SessionStateKeys.LOADED_RECIPE_COVERAGE] = defaults.recipe_coverage_pct
         st.session_state.pop(SessionStateKeys.ADV_RECIPE_COVERAGE_SLIDER, None)
 
         for loaded_key, widget_key in [
@@ -665,18 +804,18 @@ def render_advanced_search_page(
             st.session_state[loaded_key] = []
             st.session_state.pop(widget_key, None)
 
-        all_sources_list = [
-            s
-            for s in st.session_state.get(SessionStateKeys.ALL_SOURCES_LIST, [])
-            if s != UiText.ERROR_SOURCES_DISPLAY
-        ]
+        all_sources_list = _filter_sources(
+            st.session_state.get(SessionStateKeys.ALL_SOURCES_LIST, [])
+        )
         st.session_state[SessionStateKeys.LOADED_SOURCES] = all_sources_list
         st.session_state.pop(SessionStateKeys.ADV_SOURCE_SELECTOR, None)
 
         st.session_state[SessionStateKeys.ADVANCED_SEARCH_RESULTS_HTML] = defaults.profile_message
         st.session_state[SessionStateKeys.ADVANCED_SEARCH_MAPPING] = {}
+        st.session_state[SessionStateKeys.ADVANCED_SEARCH_LABEL_INDEX] = {}
         st.session_state[SessionStateKeys.ADVANCED_SELECTED_RECIPE_LABEL] = None
         st.session_state[SessionStateKeys.ADVANCED_SEARCH_RESULTS_DF] = None
+        st.session_state.pop(SessionStateKeys.LAST_SAVED_PROFILE_HASH, None)
 
         st.success(UiText.SUCCESS_FIELDS_RESET)
 
@@ -716,11 +855,14 @@ def render_advanced_search_page(
             else:
                 st.warning(UiText.WARNING_NO_INGREDIENTS_FROM_IMAGE)
 
+        # Snapshot after the image block, which may have updated the loaded text.
+        ss = st.session_state.to_dict()
+
         st.text_area(
             UiText.LABEL_INGREDIENTS,
             height=100,
             key=SessionStateKeys.ADV_INGREDIENTS_INPUT,
-            value=st.session_state.get(
+            value=ss.get(
                 SessionStateKeys.LOADED_INGREDIENTS_TEXT, defaults.ingredients_text
             ),
             placeholder=UiText.PLACEHOLDER_INGREDIENTS,
@@ -731,7 +873,7 @@ def render_advanced_search_page(
             min_value=0,
             step=1,
             key=SessionStateKeys.ADV_MIN_ING_MATCHES_INPUT,
-            value=st.session_state.get(
+            value=ss.get(
                 SessionStateKeys.LOADED_MIN_ING_MATCHES, defaults.min_ing_matches
             ),
             help=UiText.HELP_MIN_MATCHES,
@@ -742,7 +884,7 @@ def render_advanced_search_page(
             min_value=0,
             step=1,
             key=SessionStateKeys.ADV_MAX_STEPS_INPUT,
-            value=st.session_state.get(
+            value=ss.get(
                 SessionStateKeys.LOADED_MAX_STEPS, defaults.max_steps
             ),
         )
@@ -752,7 +894,7 @@ def render_advanced_search_page(
                 UiText.LABEL_MUST_USE,
                 height=75,
                 key=SessionStateKeys.ADV_MUST_USE_INPUT,
-                value=st.session_state.get(
+                value=ss.get(
                     SessionStateKeys.LOADED_MUST_USE_TEXT, defaults.must_use_text
                 ),
                 placeholder=UiText.PLACEHOLDER_MUST_USE,
@@ -761,7 +903,7 @@ def render_advanced_search_page(
                 UiText.LABEL_EXCLUDE_INGS,
                 height=75,
                 key=SessionStateKeys.ADV_EXCLUDED_INPUT,
-                value=st.session_state.get(
+                value=ss.get(
                     SessionStateKeys.LOADED_EXCLUDED_TEXT, defaults.excluded_text
                 ),
                 placeholder=UiText.PLACEHOLDER_EXCLUDE_INGS,
@@ -770,7 +912,7 @@ def render_advanced_search_page(
                 UiText.LABEL_KEYWORDS_INCLUDE,
                 height=75,
                 key=SessionStateKeys.ADV_KEYWORDS_INCLUDE_INPUT,
-                value=st.session_state.get(
+                value=ss.get(
                     SessionStateKeys.LOADED_KEYWORDS_INCLUDE, defaults.keywords_include
                 ),
                 placeholder=UiText.PLACEHOLDER_KEYWORDS_INCLUDE,
@@ -779,7 +921,7 @@ def render_advanced_search_page(
                 UiText.LABEL_KEYWORDS_EXCLUDE,
                 height=75,
                 key=SessionStateKeys.ADV_KEYWORDS_EXCLUDE_INPUT,
-                value=st.session_state.get(
+                value=ss.get(
                     SessionStateKeys.LOADED_KEYWORDS_EXCLUDE, defaults.keywords_exclude
                 ),
                 placeholder=UiText.PLACEHOLDER_KEYWORDS_EXCLUDE,
@@ -788,7 +930,7 @@ def render_advanced_search_page(
         with st.expander(UiText.EXPANDER_TAG_FILTERS):
             tag_filter_options = [TagFilterMode.AND, TagFilterMode.OR]
 
-            current_mode_enum = st.session_state.get(
+            current_mode_enum = ss.get(
                 SessionStateKeys.LOADED_TAG_FILTER_MODE, default_tag_filter_mode_enum
             )
 
@@ -836,7 +978,7 @@ def render_advanced_search_page(
                         str(cat_key).replace("_", " ").title(),
                         options=config.category_choices.get(cat_key, []),
                         key=widget_key,
-                        default=st.session_state.get(loaded_key, []),
+                        default=ss.get(loaded_key, []),
                     )
             with exclude_col:
                 st.write(UiText.LABEL_EXCLUDE_TAGS)
@@ -871,7 +1013,7 @@ def render_advanced_search_page(
                         str(cat_key).replace("_", " ").title() + " ",
                         options=config.category_choices.get(cat_key, []),
                         key=widget_key,
-                        default=st.session_state.get(loaded_key, []),
+                        default=ss.get(loaded_key, []),
                     )
 
             st.slider(
@@ -881,9 +1023,9 @@ def render_advanced_search_page(
                 step=1.0,
                 format=FormatStrings.SLIDER_PERCENT,
                 key=SessionStateKeys.ADV_USER_COVERAGE_SLIDER,
-                value=st.session_state.get(
+                value=ss.get(
                     SessionStateKeys.LOADED_USER_COVERAGE,
-                    defaults.user_coverage * 100.0,
+                    defaults.user_coverage_pct,
                 ),
                 help=UiText.HELP_USER_COVERAGE,
             )
@@ -894,23 +1036,21 @@ def render_advanced_search_page(
                 step=1.0,
                 format=FormatStrings.SLIDER_PERCENT,
                 key=SessionStateKeys.ADV_RECIPE_COVERAGE_SLIDER,
-                value=st.session_state.get(
+                value=ss.get(
                     SessionStateKeys.LOADED_RECIPE_COVERAGE,
-                    defaults.recipe_coverage * 100.0,
+                    defaults.recipe_coverage_pct,
                 ),
                 help=UiText.HELP_RECIPE_COVERAGE,
             )
 
         with st.expander(UiText.EXPANDER_SOURCE_SELECT):
-            available_sources = [
-                s
-                for s in st.session_state.get(SessionStateKeys.ALL_SOURCES_LIST, [])
-                if s != UiText.ERROR_SOURCES_DISPLAY
-            ]
+            available_sources = _filter_sources(
+                ss.get(SessionStateKeys.ALL_SOURCES_LIST, [])
+            )
 
             default_loaded_sources = [
                 s
-                for s in st.session_state.get(SessionStateKeys.LOADED_SOURCES, [])
+                for s in ss.get(SessionStateKeys.LOADED_SOURCES, [])
                 if s in available_sources
             ]
             st.multiselect(
@@ -954,7 +1094,7 @@ def render_advanced_search_page(
                 )
 
             st.markdown(
-                st.session_state.get(
+                ss.get(
                     SessionStateKeys.PROFILE_STATUS_MESSAGE, defaults.profile_message
                 ),
                 unsafe_allow_html=True,
@@ -998,25 +1138,22 @@ def render_advanced_search_page(
         recipe_mapping = st.session_state.get(
             SessionStateKeys.ADVANCED_SEARCH_MAPPING, {}
         )
-        recipe_options = list(recipe_mapping.keys())
+        recipe_options = list(recipe_mapping)
+        label_index = st.session_state.get(
+            SessionStateKeys.ADVANCED_SEARCH_LABEL_INDEX, {}
+        )
 
         current_selection_label = st.session_state.get(
             SessionStateKeys.ADVANCED_SELECTED_RECIPE_LABEL
         )
 
-        selected_index = 0
-        if current_selection_label and current_selection_label in recipe_options:
-            try:
-                selected_index = recipe_options.index(current_selection_label)
-            except ValueError:
-                log_with_payload(
-                    logging.WARNING,
-                    LogMsg.RECIPE_LABEL_NOT_FOUND_IN_OPTIONS,
-                    label=current_selection_label,
-                )
-                selected_index = 0
-        elif recipe_options:
-            selected_index = 0
+        selected_index = label_index.get(current_selection_label, 0)
+        if current_selection_label and current_selection_label not in label_index:
+            log_with_payload(
+                logging.WARNING,
+                LogMsg.RECIPE_LABEL_NOT_FOUND_IN_OPTIONS,
+                label=current_selection_label,
+            )
 
         if not recipe_options:
             st.selectbox(
@@ -1,27 +1,33 @@
-import base64
 import logging
 import os
 import subprocess
 
 import streamlit as st
-from streamlit.components import v1 as components
 
 from config import AppConfig
 from ebook_utils import to_pdf_cached
 from gdrive_utils import download_gdrive_file, list_drive_books_cached
 from log_utils import LibraryPayload, ErrorPayload, log_with_payload
 from session_state import SessionStateKeys
-from constants import GDriveKeys, LogMsg
+from constants import GDriveKeys, LogMsg, MiscValues
 from ui_helpers import UiText
 
 
+@st.cache_resource(max_entries=5)
+def _pdf_bytes(pdf_path: str, mtime: float) -> bytes:
+    """Read a prepared PDF once; ``mtime`` invalidates the entry on reconvert."""
+    with open(pdf_path, "rb") as f:
+        return f.read()
+
+
 def render_library_page(st: st, config: AppConfig) -> None:
     def on_book_select():
         """Streamlit callback: download + convert the newly-selected book with a spinner."""
-        label = st.session_state[SessionStateKeys.LIBRARY_BOOK_SELECTOR]
+        ss = st.session_state
+        label = ss[SessionStateKeys.LIBRARY_BOOK_SELECTOR]
         if not label:
             return
-        mapping = st.session_state[SessionStateKeys.LIBRARY_BOOK_MAPPING]
+        mapping = ss[SessionStateKeys.LIBRARY_BOOK_MAPPING]
         details = mapping[label]
         with st.spinner(UiText.SPINNER_PREPARING_BOOK.format(label=label)):
             local_file = download_gdrive_file(
@@ -30,7 +36,7 @@ def render_library_page(st: st, config: AppConfig) -> None:
                 config.book_dir,
             )
             pdf = to_pdf_cached(local_file, config.temp_dir)
-        st.session_state["_prepared_pdf"] = pdf
+        ss["_prepared_pdf"] = {label: pdf}
 
     st.header(UiText.HEADER_LIBRARY)
 
@@ -39,16 +45,18 @@ def render_library_page(st: st, config: AppConfig) -> None:
 
         list_drive_books_cached.clear()
         to_pdf_cached.clear()
+        _pdf_bytes.clear()
 
+        ss = st.session_state
+        ss.pop("_prepared_pdf", None)
         try:
-            _, new_mapping = list_drive_books_cached()
-            st.session_state[SessionStateKeys.LIBRARY_BOOK_MAPPING] = new_mapping
+            new_labels, new_mapping = list_drive_books_cached()
+            ss[SessionStateKeys.LIBRARY_BOOK_LABELS] = new_labels
+            ss[SessionStateKeys.LIBRARY_BOOK_MAPPING] = new_mapping
 
-            current_selection = st.session_state.get(
-                SessionStateKeys.LIBRARY_BOOK_SELECTOR
-            )
+            current_selection = ss.get(SessionStateKeys.LIBRARY_BOOK_SELECTOR)
             if current_selection and current_selection not in new_mapping:
-                st.session_state[SessionStateKeys.LIBRARY_BOOK_SELECTOR] = None
+                ss[SessionStateKeys.LIBRARY_BOOK_SELECTOR] = None
                 log_with_payload(
                     logging.INFO,
                     LogMsg.LIBRARY_SELECTION_RESET,
@@ -67,33 +75,32 @@ def render_library_page(st: st, config: AppConfig) -> None:
             )
             st.error(UiText.ERROR_BOOKS_LOAD_FAIL.format(error=e))
 
-    book_mapping_state = st.session_state.get(SessionStateKeys.LIBRARY_BOOK_MAPPING, {})
-    book_options = list(book_mapping_state.keys())
-    display_book_options = [
-        opt for opt in book_options if opt != UiText.ERROR_BOOKS_DISPLAY
-    ]
+    ss = st.session_state
+    book_mapping_state = ss.get(SessionStateKeys.LIBRARY_BOOK_MAPPING, {})
+    book_options = ss.get(SessionStateKeys.LIBRARY_BOOK_LABELS, [])
+    has_books_error = UiText.ERROR_BOOKS_DISPLAY in book_mapping_state
+    display_book_options = (
+        [opt for opt in book_options if opt != UiText.ERROR_BOOKS_DISPLAY]
+        if has_books_error
+        else book_options
+    )
     if not display_book_options:
-        if UiText.ERROR_BOOKS_DISPLAY in book_options:
+        if has_books_error:
             st.error(UiText.ERROR_BOOKS_DISPLAY)
         else:
             st.warning(UiText.WARN_NO_BOOKS_FOUND)
     else:
-        current_book_selection = st.session_state.get(
-            SessionStateKeys.LIBRARY_BOOK_SELECTOR
-        )
-        current_index = 0
-        if current_book_selection and current_book_selection in display_book_options:
-            try:
-                current_index = display_book_options.index(current_book_selection)
-            except ValueError:
-                log_with_payload(
-                    logging.WARNING,
-                    LogMsg.LIBRARY_BOOK_SELECTION_INVALID,
-                    selection=current_book_selection,
-                )
-                current_index = 0
-        elif display_book_options:
-            current_index = 0
+        current_book_selection = ss.get(SessionStateKeys.LIBRARY_BOOK_SELECTOR)
+        book_positions = {
+            label: i for i, label in enumerate(display_book_options)
+        }
+        current_index = book_positions.get(current_book_selection, 0)
+        if current_book_selection and current_book_selection not in book_positions:
+            log_with_payload(
+                logging.WARNING,
+                LogMsg.LIBRARY_BOOK_SELECTION_INVALID,
+                selection=current_book_selection,
+            )
 
         selected_book_label = st.selectbox(
             UiText.SELECTBOX_LABEL_BOOK,
@@ -102,7 +109,7 @@ def render_library_page(st: st, config: AppConfig) -> None:
             index=current_index,
             on_change=on_book_select,
         )
-        st.session_state["_book_placeholder"] = st.empty()
+        ss["_book_placeholder"] = st.empty()
         if selected_book_label:
             st.markdown("---")
 
@@ -146,16 +153,27 @@ def render_library_page(st: st, config: AppConfig) -> None:
                     )
                     placeholder.error(UiText.ERROR_BOOK_MISSING_DETAILS)
                 else:
-                    with st.spinner(
-                        UiText.SPINNER_PROCESSING_BOOK.format(filename=file_name)
-                    ):
-                        local_file_path = download_gdrive_file(
-                            file_id, file_name, book_dir_path
-                        )
+                    # on_book_select (or an earlier rerun) may already have
+                    # prepared this book; skip the download and conversion then.
+                    pdf_path = ss.get("_prepared_pdf", {}).get(selected_book_label)
+                    if pdf_path and os.path.exists(pdf_path):
+                        local_file_path = pdf_path
+                    else:
+                        pdf_path = None
+                        with st.spinner(
+                            UiText.SPINNER_PROCESSING_BOOK.format(filename=file_name)
+                        ):
+                            local_file_path = download_gdrive_file(
+                                file_id, file_name, book_dir_path
+                            )
 
                     if local_file_path:
                         try:
-                            pdf_path = to_pdf_cached(local_file_path, config.temp_dir)
+                            if pdf_path is None:
+                                pdf_path = to_pdf_cached(
+                                    local_file_path, config.temp_dir
+                                )
+                                ss["_prepared_pdf"] = {selected_book_label: pdf_path}
 
                             payload.file_path = pdf_path
 
@@ -166,50 +184,17 @@ def render_library_page(st: st, config: AppConfig) -> None:
                                 pdf_path=pdf_path,
                             )
 
-                            pdf_path = st.session_state.get("_prepared_pdf")
                             if pdf_path:
-                                b64 = base64.b64encode(
-                                    open(pdf_path, "rb").read()
-                                ).decode("utf-8")
-                                html = f'''
-                                <style>
-                                  /* Inline styles inside the iframe */
-                                  #openBtn {{
-                                    background-color: var(--primary-color) !important;
-                                    color: white !important;
-                                    border: none !important;
-                                    border-radius: 4px !important;
-                                    font-size: 14px !important;
-                                    font-weight: 600 !important;
-                                    padding: 0.5em 1em !important;
-                                    cursor: pointer !important;
-                                    display: inline-flex;
-                                    align-items: center;
-                                    gap: 0.25em;
-                                  }}
-                                  #openBtn:hover {{
-                                    background-color: var(--primary-color-dark) !important;
-                                  }}
-                                </style>
-
-                                <button id="openBtn">📖 {UiText.BUTTON_OPEN_BOOK_PDF}</button>
-
-                                <script>
-                                  document.getElementById("openBtn").onclick = () => {{
-                                    const bin = atob("{b64}");
-                                    const len = bin.length;
-                                    const bytes = new Uint8Array(len);
-                                    for (let i = 0; i < len; i++) {{
-                                      bytes[i] = bin.charCodeAt(i);
-                                    }}
-                                    const blob = new Blob([bytes], {{ type: "application/pdf" }});
-                                    const url = URL.createObjectURL(blob);
-                                    window.open(url, "_blank");
-                                  }};
-                                </script>
-                                '''
-
-                                components.html(html, height=60)
+                                # Served through Streamlit's media endpoint on
+                                # click, not inlined into the page as base64.
+                                st.download_button(
+                                    f"📖 {UiText.BUTTON_DOWNLOAD_BOOK_PDF}",
+                                    data=_pdf_bytes(
+                                        pdf_path, os.path.getmtime(pdf_path)
+                                    ),
+                                    file_name=os.path.basename(pdf_path),
+                                    mime=MiscValues.PDF_MIME,
+                                )
 
                         except FileNotFoundError as e:
                             placeholder.empty()
@@ -1,5 +1,6 @@
 import json
 import logging
+from collections import defaultdict
 
 import pandas as pd
 import streamlit as st
@@ -42,6 +43,7 @@ def render_simple_search_page(st: st, config: AppConfig) -> None:
                 UiText.MSG_SIMPLE_QUERY_PROMPT
             )
             st.session_state[SessionStateKeys.SIMPLE_SEARCH_MAPPING] = {}
+            st.session_state[SessionStateKeys.SIMPLE_SEARCH_LABEL_INDEX] = {}
             st.session_state[SessionStateKeys.SIMPLE_SEARCH_RESULTS_DF] = None
             st.session_state[SessionStateKeys.SIMPLE_SELECTED_RECIPE_LABEL] = None
             return
@@ -100,6 +102,7 @@ def render_simple_search_page(st: st, config: AppConfig) -> None:
                 UiText.ERROR_DURING_SIMPLE_SEARCH.format(error=e)
             )
             st.session_state[SessionStateKeys.SIMPLE_SEARCH_MAPPING] = {}
+            st.session_state[SessionStateKeys.SIMPLE_SEARCH_LABEL_INDEX] = {}
             st.session_state[SessionStateKeys.SIMPLE_SEARCH_RESULTS_DF] = None
             st.session_state[SessionStateKeys.SIMPLE_SELECTED_RECIPE_LABEL] = None
             return
@@ -112,6 +115,7 @@ def render_simple_search_page(st: st, config: AppConfig) -> None:
                 UiText.MSG_SIMPLE_NO_RESULTS.format(query_text=query_text)
             )
             st.session_state[SessionStateKeys.SIMPLE_SEARCH_MAPPING] = {}
+            st.session_state[SessionStateKeys.SIMPLE_SEARCH_LABEL_INDEX] = {}
             st.session_state[SessionStateKeys.SIMPLE_SEARCH_RESULTS_DF] = None
             st.session_state[SessionStateKeys.SIMPLE_SELECTED_RECIPE_LABEL] = None
         else:
@@ -123,38 +127,44 @@ def render_simple_search_page(st: st, config: AppConfig) -> None:
                 count=len(results),
             )
 
-            simple_results_data_for_df = []
+            titles: list[str] = []
+            urls: list[str] = []
             simple_mapping = {}
+            title_counts: defaultdict[str, int] = defaultdict(int)
             for r in results:
                 url = r.get(RecipeKeys.URL, UiText.DEFAULT_RECIPE_URL)
                 title = r.get(RecipeKeys.TITLE, UiText.DEFAULT_RECIPE_TITLE)
                 recipe_content_dict = r.get(RecipeKeys.RECIPE, {})
 
-                simple_df_row = {
-                    "Recipe Title": title,
-                    "Source / URL": url,
-                }
-                simple_results_data_for_df.append(simple_df_row)
+                titles.append(title)
+                urls.append(url)
 
+                # Resume numbering from the last suffix used for this title; the
+                # loop only repeats if a real title already looks like "X (n)".
+                count = title_counts[title]
                 label = title
-                original_label = label
-                count = 1
                 while label in simple_mapping:
+                    count += 1
                     label = FormatStrings.RECIPE_LABEL_DUPLICATE.format(
-                        original_label=original_label, count=count
+                        original_label=title, count=count
                     )
-                    count += 1
+                title_counts[title] = count
                 simple_mapping[label] = {
                     RecipeKeys.URL: url,
                     RecipeKeys.RECIPE: recipe_content_dict,
                 }
 
-            simple_results_df = pd.DataFrame(simple_results_data_for_df)
+            simple_results_df = pd.DataFrame(
+                {"Recipe Title": titles, "Source / URL": urls}
+            )
 
             st.session_state[SessionStateKeys.SIMPLE_SEARCH_RESULTS_DF] = (
                 simple_results_df
             )
             st.session_state[SessionStateKeys.SIMPLE_SEARCH_MAPPING] = simple_mapping
+            st.session_state[SessionStateKeys.SIMPLE_SEARCH_LABEL_INDEX] = {
+                label: i for i, label in enumerate(simple_mapping)
+            }
 
             st.session_state[SessionStateKeys.SIMPLE_SEARCH_RESULTS_HTML] = (
                 MiscValues.EMPTY
@@ -200,23 +210,13 @@ def render_simple_search_page(st: st, config: AppConfig) -> None:
     simple_recipe_mapping = st.session_state.get(
         SessionStateKeys.SIMPLE_SEARCH_MAPPING, {}
     )
-    simple_recipe_options = list(simple_recipe_mapping.keys())
+    simple_recipe_options = tuple(simple_recipe_mapping)
     current_simple_selection_label = st.session_state.get(
         SessionStateKeys.SIMPLE_SELECTED_RECIPE_LABEL
     )
-    selected_simple_index = 0
-    if (
-        current_simple_selection_label
-        and current_simple_selection_label in simple_recipe_options
-    ):
-        try:
-            selected_simple_index = simple_recipe_options.index(
-                current_simple_selection_label
-            )
-        except ValueError:
-            selected_simple_index = 0
-    elif simple_recipe_options:
-        selected_simple_index = 0
+    selected_simple_index = st.session_state.get(
+        SessionStateKeys.SIMPLE_SEARCH_LABEL_INDEX, {}
+    ).get(current_simple_selection_label, 0)
     if not simple_recipe_options:
         st.selectbox(
             UiText.SELECTBOX_LABEL_RECIPE,